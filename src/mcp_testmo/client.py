@@ -6,14 +6,73 @@ Designed for use within the MCP server.
 """
 
 import asyncio
+import base64
+import binascii
+import hashlib
+import json
 import os
-from typing import Any
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, ClassVar
 
 import httpx
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the extra
+    orjson = None  # type: ignore[assignment]
+
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    """
+    Load a .env file the first time a client needs configuration.
+
+    Deferred from import time so importing the package does no file I/O.
+    Variables already in the environment are not overridden. Skipped when
+    MCP_TESTMO_SKIP_DOTENV is set.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+    if os.environ.get("MCP_TESTMO_SKIP_DOTENV"):
+        return
+    load_dotenv()
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode JSON to bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _query_params(**params: Any) -> dict[str, Any]:
+    """
+    Build query parameters, dropping unset filters.
+
+    None and empty values are dropped, except booleans (False is a valid
+    filter). Lists are sent comma-separated.
+    """
+    return {
+        key: ",".join(value) if isinstance(value, list) else value
+        for key, value in params.items()
+        if value is not None and (value or isinstance(value, bool))
+    }
+
+
+def _json_loads(content: bytes | str) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 class TestmoAPIError(Exception):
@@ -26,6 +85,195 @@ class TestmoAPIError(Exception):
         super().__init__(f"Testmo API Error {status_code}: {message}")
 
 
+# (endpoint, sorted query params) identifying a cacheable GET
+_CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+# Cache key plus the conditional headers an in-flight GET was sent with
+_InflightKey = tuple[_CacheKey, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A cached response body with its HTTP validators."""
+
+    fetched_at: float
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class _ConcurrencyLimiter:
+    """
+    Cap on requests in flight that can be resized while in use.
+
+    Unlike ``asyncio.Semaphore``, the limit can shrink when the server
+    pushes back (HTTP 429) and grow back as requests succeed. Waiters are
+    woken in FIFO order by the underlying condition.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.max_limit = limit
+        self.limit = limit
+        self.in_flight = 0
+        self._cv = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._cv:
+            try:
+                await self._cv.wait_for(lambda: self.in_flight < self.limit)
+            except asyncio.CancelledError:
+                # Pass on a wake-up this waiter may have consumed, so the
+                # next waiter is not left sleeping beside a free slot
+                if self.in_flight < self.limit:
+                    self._cv.notify(1)
+                raise
+            self.in_flight += 1
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        async with self._cv:
+            self.in_flight -= 1
+            self._cv.notify(1)
+
+    async def back_off(self) -> None:
+        """Halve the limit (never below one)."""
+        async with self._cv:
+            self.limit = max(1, self.limit // 2)
+
+    async def recover(self) -> None:
+        """Raise the limit by one, up to its original value."""
+        if self.limit >= self.max_limit:
+            return
+        async with self._cv:
+            self.limit = min(self.max_limit, self.limit + 1)
+            self._cv.notify(1)
+
+
+class _RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that paces outgoing requests with a token bucket.
+
+    Requests pass straight through while tokens are available, so bursts up to
+    ``capacity`` are not delayed. Once the bucket is empty, requests wait only
+    as long as needed to stay within ``rate`` requests per second. ``clock``
+    and ``sleep`` can be replaced to drive the bucket without real waiting.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self._transport = transport
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def _acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        async with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self._rate)
+                self._tokens = 1.0
+                self._updated = self._clock()
+            self._tokens -= 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._acquire()
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+async def iter_pages(
+    fetch_page: Callable[[int], Awaitable[dict[str, Any]]],
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Yield the results of every page of a paginated endpoint.
+
+    Page 1 is fetched first. If it reports ``last_page`` (or ``total`` and
+    ``per_page``), the remaining pages are requested concurrently;
+    otherwise ``next_page`` is followed with the next page prefetched while
+    the caller consumes the current one. Items are yielded in page order as
+    soon as their page arrives, and pending requests are cancelled (and
+    awaited) if the caller stops early.
+
+    Args:
+        fetch_page: Coroutine function returning the response for a page number.
+
+    Yields:
+        Items from all pages, in page order.
+    """
+    result = await fetch_page(1)
+    if result.get("next_page") is None:
+        for item in result.get("result", []):
+            yield item
+        return
+
+    last_page = result.get("last_page")
+    total, per_page = result.get("total"), result.get("per_page")
+    if not isinstance(last_page, int) and isinstance(total, int) and per_page:
+        last_page = -(-total // per_page)
+    if isinstance(last_page, int) and last_page > 1:
+        tasks = [
+            asyncio.ensure_future(fetch_page(page))
+            for page in range(2, last_page + 1)
+        ]
+        try:
+            for item in result.get("result", []):
+                yield item
+            for task in tasks:
+                page_result = await task
+                for item in page_result.get("result", []):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled fetches unwind (and their errors be consumed)
+            # before the caller moves on
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return
+
+    page = 1
+    while True:
+        next_task = None
+        if result.get("next_page") is not None:
+            next_task = asyncio.ensure_future(fetch_page(page + 1))
+        try:
+            for item in result.get("result", []):
+                yield item
+        except BaseException:
+            # The caller stopped early (or failed); drop the prefetch
+            if next_task is not None:
+                next_task.cancel()
+                await asyncio.gather(next_task, return_exceptions=True)
+            raise
+        if next_task is None:
+            return
+        result = await next_task
+        page += 1
+
+
 class TestmoClient:
     """
     Async client for interacting with Testmo REST API.
@@ -34,14 +282,46 @@ class TestmoClient:
         async with TestmoClient() as client:
             projects = await client.list_projects()
 
+    Long-running processes should use ``TestmoClient.shared()``, whose
+    connection pool stays open across ``async with`` blocks until
+    ``aclose()`` is called.
+
     Environment Variables:
         TESTMO_URL: Base URL for Testmo instance (e.g., https://your-instance.testmo.net)
         TESTMO_API_KEY: API token for authentication
+        TESTMO_HTTPX_BACKEND: HTTP transport, "httpx" (default) or "aiohttp"
+            (requires the "aiohttp" extra)
+        TESTMO_CONCURRENCY: Maximum requests in flight (default: MAX_CONCURRENCY)
+        TESTMO_RATE_LIMIT_RPS: Sustained requests per second (default:
+            RATE_LIMIT_RPS)
+        TESTMO_RATE_LIMIT_BURST: Requests allowed back-to-back before pacing
+            starts (default: RATE_LIMIT_BURST)
+        TESTMO_CACHE_TTL: Seconds to reuse cached reads (default: CACHE_TTL;
+            0 revalidates every read)
+        TESTMO_CACHE_DIR: Directory for persisting cached responses across
+            runs (optional; in-memory only when unset)
     """
 
     MAX_CASES_PER_REQUEST = 100
+    # Bulk request errors that are worth retrying case by case
+    BULK_FALLBACK_STATUSES = frozenset({400, 404, 422})
     REQUEST_TIMEOUT = 30.0
-    RATE_LIMIT_DELAY = 0.5
+    CONNECT_TIMEOUT = 5.0
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 30.0
+    MAX_CONCURRENCY = 10
+    RATE_LIMIT_RPS = 5.0
+    RATE_LIMIT_BURST = 10
+    CACHE_TTL = 60.0
+    CACHE_FORMAT_VERSION = 1
+    WARMUP_ON_ENTER = True
+    HTTP_BACKENDS = ("httpx", "aiohttp")
+
+    _shared: ClassVar["TestmoClient | None"] = None
 
     def __init__(
         self,
@@ -55,6 +335,9 @@ class TestmoClient:
             base_url: Testmo instance URL (default: TESTMO_URL env var)
             api_key: API token (default: TESTMO_API_KEY env var)
         """
+        # Optional settings (TESTMO_CONCURRENCY, ...) may live in .env too
+        _load_dotenv_once()
+
         self.base_url = (base_url or os.environ.get("TESTMO_URL", "")).rstrip("/")
         self.api_key = api_key or os.environ.get("TESTMO_API_KEY", "")
 
@@ -66,28 +349,176 @@ class TestmoClient:
             raise ValueError(
                 "TESTMO_API_KEY not set. Set environment variable or pass api_key parameter."
             )
+        self.api_root = f"{self.base_url}/api/v1"
+        # Content-Type is set per request so multipart uploads get their own
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+        }
+        self._timeout = httpx.Timeout(
+            self.REQUEST_TIMEOUT, connect=self.CONNECT_TIMEOUT
+        )
+
+        self.http_backend = os.environ.get("TESTMO_HTTPX_BACKEND", "httpx").lower()
+        if self.http_backend not in self.HTTP_BACKENDS:
+            raise ValueError(
+                f"Unsupported TESTMO_HTTPX_BACKEND: {self.http_backend}. "
+                f"Expected one of: {', '.join(self.HTTP_BACKENDS)}."
+            )
+
+        concurrency = os.environ.get("TESTMO_CONCURRENCY", str(self.MAX_CONCURRENCY))
+        if not concurrency.isdigit() or int(concurrency) < 1:
+            raise ValueError(
+                f"Invalid TESTMO_CONCURRENCY: {concurrency}. Expected a positive integer."
+            )
+        self.max_concurrency = int(concurrency)
+
+        rate = os.environ.get("TESTMO_RATE_LIMIT_RPS", str(self.RATE_LIMIT_RPS))
+        try:
+            self.rate_limit_rps = float(rate)
+        except ValueError:
+            self.rate_limit_rps = 0.0  # Reported as invalid below
+        if not self.rate_limit_rps > 0:
+            raise ValueError(
+                f"Invalid TESTMO_RATE_LIMIT_RPS: {rate}. Expected a positive number."
+            )
+
+        burst = os.environ.get("TESTMO_RATE_LIMIT_BURST", str(self.RATE_LIMIT_BURST))
+        if not burst.isdigit() or int(burst) < 1:
+            raise ValueError(
+                f"Invalid TESTMO_RATE_LIMIT_BURST: {burst}. Expected a positive integer."
+            )
+        self.rate_limit_burst = int(burst)
+
+        cache_ttl = os.environ.get("TESTMO_CACHE_TTL")
+        if cache_ttl:
+            try:
+                self.CACHE_TTL = float(cache_ttl)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid TESTMO_CACHE_TTL: {cache_ttl}. Expected a number of seconds."
+                )
+
+        cache_dir = os.environ.get("TESTMO_CACHE_DIR")
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        # Scope persisted entries by instance and credentials so users never
+        # share them; hashed once rather than per cache lookup
+        self._cache_namespace = hashlib.sha256(
+            f"{self.base_url}\0{self.api_key}".encode()
+        ).hexdigest()
 
         self._client: httpx.AsyncClient | None = None
+        self._persistent = False
+        self._warmup: asyncio.Task[None] | None = None
+        self._limiter = _ConcurrencyLimiter(self.max_concurrency)
+        self._cache: dict[_CacheKey, _CacheEntry] = {}
+        # Bumped per scope on every write so a GET that was in flight
+        # across the write doesn't cache the pre-write response
+        self._cache_generation: dict[str, int] = {}
+        # project_id -> (built at, {(parent_id, name): folder})
+        self._folder_index: dict[
+            int, tuple[float, dict[tuple[int, str], dict[str, Any]]]
+        ] = {}
+        # Identical GETs in flight share one request
+        self._inflight: dict[_InflightKey, asyncio.Future[httpx.Response]] = {}
+
+    def _build_transport(self) -> httpx.AsyncBaseTransport:
+        """
+        Build the rate-limited transport for the configured HTTP backend.
+
+        Returns:
+            Transport enforcing rate_limit_rps / rate_limit_burst.
+        """
+        limits = httpx.Limits(
+            max_connections=self.MAX_CONNECTIONS,
+            max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=self.KEEPALIVE_EXPIRY,
+        )
+
+        transport: httpx.AsyncBaseTransport
+        if self.http_backend == "aiohttp":
+            try:
+                from httpx_aiohttp import AiohttpTransport
+            except ImportError as e:
+                raise RuntimeError(
+                    "TESTMO_HTTPX_BACKEND=aiohttp requires the 'aiohttp' extra: "
+                    "pip install 'mcp-testmo[aiohttp]'"
+                ) from e
+            # aiohttp speaks HTTP/1.1 only; pool limits still apply per host.
+            transport = AiohttpTransport(limits=limits)
+        else:
+            transport = httpx.AsyncHTTPTransport(http2=True, limits=limits)
+
+        return _RateLimitedTransport(
+            transport, self.rate_limit_rps, self.rate_limit_burst
+        )
+
+    @classmethod
+    def shared(cls) -> "TestmoClient":
+        """
+        Get the process-wide client, creating it on first use.
+
+        Entering and exiting the shared client opens its HTTP client once and
+        then leaves it open, so keep-alive connections and HTTP/2 streams
+        survive between calls. Close it with ``close_shared()`` at shutdown.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+            cls._shared._persistent = True
+        return cls._shared
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        """Close and discard the process-wide client, if one was created."""
+        if cls._shared is not None:
+            await cls._shared.aclose()
+            cls._shared = None
 
     async def __aenter__(self) -> "TestmoClient":
         """Async context manager entry."""
+        if self._client is not None and self._persistent:
+            return self
+
         self._client = httpx.AsyncClient(
-            base_url=f"{self.base_url}/api/v1",
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            timeout=httpx.Timeout(self.REQUEST_TIMEOUT),
+            base_url=self.api_root,
+            headers=self._headers,
+            timeout=self._timeout,
+            transport=self._build_transport(),
         )
+        # Only the long-lived shared client benefits; a short-lived client
+        # would pay for a full project listing it may never use
+        if self._persistent and self.WARMUP_ON_ENTER:
+            self._warmup = asyncio.create_task(self._warm_up())
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
+        """Async context manager exit (the shared client stays open)."""
+        if not self._persistent:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        if self._warmup is not None:
+            self._warmup.cancel()
+            self._warmup = None
         if self._client:
             await self._client.aclose()
             self._client = None
 
+    async def _warm_up(self) -> None:
+        """
+        Open a pooled connection in the background.
+
+        The connection setup (DNS, TCP, TLS) overlaps with the caller's first
+        request instead of preceding it. The request is ``list_projects``, so
+        its result lands in the response cache and a concurrent
+        ``list_projects`` call shares it rather than repeating it.
+        """
+        try:
+            await self.list_projects()
+        except Exception:
+            pass  # Warmup is best-effort; real calls surface their own errors
+
     @property
     def client(self) -> httpx.AsyncClient:
         """Get the HTTP client, ensuring it's initialized."""
@@ -103,36 +534,309 @@ class TestmoClient:
         endpoint: str,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        cache: bool = False,
     ) -> dict[str, Any]:
-        """Make an API request."""
+        """
+        Make an API request (at most ``max_concurrency`` in flight).
+
+        GET responses requested with ``cache=True`` are reused for CACHE_TTL
+        seconds, then revalidated with If-None-Match / If-Modified-Since when
+        the server sent validators. When TESTMO_CACHE_DIR is set they are also
+        persisted across runs. Identical GETs issued concurrently share one
+        request. Any other request invalidates cached entries under the same
+        top-level resource (e.g. ``/projects/2``).
+        """
+        cache_key: _CacheKey = (
+            endpoint,
+            tuple(sorted(params.items())) if params else (),
+        )
+        scope = self._cache_scope(endpoint)
+        generation = self._cache_generation.get(scope, 0)
+        entry: _CacheEntry | None = None
+        headers: dict[str, str] | None = None
+        if cache:
+            entry = self._cache.get(cache_key) or await self._load_cache_entry(
+                cache_key
+            )
+            if entry is not None:
+                if time.time() - entry.fetched_at < self.CACHE_TTL:
+                    # Decode per hit so callers can't mutate the cached value
+                    cached: dict[str, Any] = _json_loads(entry.body)
+                    return cached
+                headers = entry.validators() or None
+
+        if method == "GET":
+            # Only share requests sent with the same validators: a caller
+            # without a cached body can't use a 304 answered to another
+            inflight_key: _InflightKey = (
+                cache_key,
+                tuple(sorted(headers.items())) if headers else (),
+            )
+            task = self._inflight.get(inflight_key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._send(method, endpoint, None, params, headers)
+                )
+                self._inflight[inflight_key] = task
+                task.add_done_callback(
+                    lambda done: self._forget_inflight(inflight_key, done)
+                )
+            # Shield so one caller's cancellation doesn't cancel the others
+            response = await asyncio.shield(task)
+        else:
+            response = await self._send(method, endpoint, data, params)
+            await self._invalidate_cache(endpoint)
+
+        # A write to the same resource landed while this GET was in flight
+        if cache and self._cache_generation.get(scope, 0) != generation:
+            cache = False
+
+        if entry is not None and response.status_code == 304:
+            if cache:
+                entry.fetched_at = time.time()
+                await self._store_cache_entry(cache_key, entry)
+            revalidated: dict[str, Any] = _json_loads(entry.body)
+            return revalidated
+
+        result = self._handle_response(response)
+        if cache and response.status_code != 204:
+            await self._store_cache_entry(
+                cache_key,
+                _CacheEntry(
+                    fetched_at=time.time(),
+                    body=response.content,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ),
+            )
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None = None,
+        files: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """
+        Send a JSON or multipart request, mapping transport failures to
+        TestmoAPIError.
+
+        At most ``max_concurrency`` requests are in flight; the cap is halved on
+        each HTTP 429 and grows back by one per successful response. A 429 is
+        retried up to MAX_RETRIES times after waiting for ``Retry-After`` (or
+        an exponential backoff when the header is missing).
+        """
+        content = None
+        if data is not None:
+            content = _json_dumps(data)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+
+        attempt = 0
+        while True:
+            try:
+                async with self._limiter:
+                    response = await self.client.request(
+                        method=method,
+                        url=endpoint,
+                        content=content,
+                        files=files,
+                        params=params,
+                        headers=headers,
+                    )
+            except httpx.TimeoutException:
+                raise TestmoAPIError(408, "Request timed out")
+            except httpx.ConnectError as e:
+                raise TestmoAPIError(0, f"Connection error: {e}")
+
+            if response.status_code != 429:
+                if response.status_code < 400:
+                    await self._limiter.recover()
+                return response
+
+            await self._limiter.back_off()
+            delay = self._retry_delay(response, attempt)
+            # A server asking for a longer wait than we are willing to block
+            # for gets its 429 surfaced rather than an early retry
+            if attempt >= self.MAX_RETRIES or delay > self.RETRY_MAX_DELAY:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a rate-limited response.
+
+        Retry-After is used as given when present, even beyond
+        RETRY_MAX_DELAY (the caller then gives up instead of retrying early).
+        Otherwise the exponential backoff is jittered between half and all of
+        its value, so concurrent requests throttled together do not all retry
+        at the same moment.
+        """
+        backoff = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2.0**attempt)
+        backoff = random.uniform(backoff / 2, backoff)
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return backoff
         try:
-            response = await self.client.request(
-                method=method,
-                url=endpoint,
-                json=data,
-                params=params,
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return backoff
+            delay = retry_at.timestamp() - time.time()
+        return max(0.0, delay)
+
+    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
+        """Decode a response body, raising TestmoAPIError for error statuses."""
+        if response.status_code == 204:
+            return {"success": True}
+
+        if response.status_code >= 400:
+            try:
+                error_body = _json_loads(response.content)
+            except ValueError:
+                error_body = response.text
+            raise TestmoAPIError(
+                response.status_code,
+                f"Request failed: {response.reason_phrase}",
+                error_body,
             )
 
-            if response.status_code == 204:
-                return {"success": True}
-
-            if response.status_code >= 400:
-                try:
-                    error_body = response.json()
-                except Exception:
-                    error_body = response.text
-                raise TestmoAPIError(
-                    response.status_code,
-                    f"Request failed: {response.reason_phrase}",
-                    error_body,
-                )
+        result: dict[str, Any] = _json_loads(response.content)
+        return result
+
+    def _forget_inflight(
+        self, key: _InflightKey, task: "asyncio.Future[httpx.Response]"
+    ) -> None:
+        """Remove a finished shared GET, consuming any unobserved exception."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    def _cache_scope(endpoint: str) -> str:
+        """Top-level resource of an endpoint, e.g. ``/projects/1``."""
+        return "/".join(endpoint.split("/")[:3])
+
+    async def _invalidate_cache(self, endpoint: str) -> None:
+        """
+        Drop cached responses under the top-level resource of an endpoint.
+
+        Persisted files are matched by the scope hash in their name, so
+        entries written by an earlier process are dropped as well.
+        """
+        scope = self._cache_scope(endpoint)
+        self._cache_generation[scope] = self._cache_generation.get(scope, 0) + 1
+        stale = [key for key in self._cache if self._cache_scope(key[0]) == scope]
+        for key in stale:
+            del self._cache[key]
+        # Later GETs must not join a request sent before the write
+        for inflight in [k for k in self._inflight if self._cache_scope(k[0][0]) == scope]:
+            del self._inflight[inflight]
+        await self._remove_cache_files(f"{self._scope_digest(scope)}-*.json")
+
+    async def _remove_cache_files(self, pattern: str) -> None:
+        """Delete this client's persisted cache files matching a name pattern."""
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return
+
+        def remove() -> None:
+            for path in cache_dir.glob(f"{self._cache_namespace[:16]}-{pattern}"):
+                path.unlink(missing_ok=True)
+
+        try:
+            await asyncio.to_thread(remove)
+        except OSError:
+            pass  # The on-disk cache is best-effort
+
+    def _scope_digest(self, scope: str) -> str:
+        """Short hash of a cache scope, used to group persisted files."""
+        return hashlib.sha256(f"{self._cache_namespace}{scope}".encode()).hexdigest()[:16]
+
+    def _cache_path(self, key: _CacheKey) -> Path | None:
+        """File persisting a cache entry, or None when disk caching is off."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(
+            f"{self._cache_namespace}{key!r}".encode()
+        ).hexdigest()
+        scope = self._scope_digest(self._cache_scope(key[0]))
+        return self.cache_dir / f"{self._cache_namespace[:16]}-{scope}-{digest}.json"
+
+    async def clear_cache(self) -> int:
+        """
+        Drop every cached response, including persisted ones for this client.
+
+        Returns:
+            Number of cached responses dropped from memory.
+        """
+        cleared = len(self._cache)
+        self._cache.clear()
+        self._folder_index.clear()
+        await self._remove_cache_files("*.json")
+        return cleared
+
+    async def _load_cache_entry(self, key: _CacheKey) -> _CacheEntry | None:
+        """Load a persisted cache entry into memory, if one exists."""
+        path = self._cache_path(key)
+        if path is None:
+            return None
+
+        def read() -> _CacheEntry | None:
+            try:
+                stored = json.loads(path.read_text())
+            except (OSError, ValueError):
+                return None
+            if stored.get("format") != self.CACHE_FORMAT_VERSION:
+                return None
+            return _CacheEntry(
+                fetched_at=stored["fetched_at"],
+                body=stored["body"].encode(),
+                etag=stored.get("etag"),
+                last_modified=stored.get("last_modified"),
+            )
 
-            return response.json()
+        entry = await asyncio.to_thread(read)
+        if entry is not None:
+            self._cache[key] = entry
+        return entry
+
+    async def _store_cache_entry(self, key: _CacheKey, entry: _CacheEntry) -> None:
+        """Keep a cache entry in memory and persist it when disk caching is on."""
+        self._cache[key] = entry
+        path = self._cache_path(key)
+        if path is None:
+            return
+
+        def write() -> None:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            # Cached bodies are private API data: readable by the owner only
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write(
+                    json.dumps(
+                        {
+                            "format": self.CACHE_FORMAT_VERSION,
+                            "fetched_at": entry.fetched_at,
+                            "etag": entry.etag,
+                            "last_modified": entry.last_modified,
+                            "body": entry.body.decode(),
+                        }
+                    )
+                )
+            tmp.replace(path)
 
-        except httpx.TimeoutException:
-            raise TestmoAPIError(408, "Request timed out")
-        except httpx.ConnectError as e:
-            raise TestmoAPIError(0, f"Connection error: {e}")
+        try:
+            await asyncio.to_thread(write)
+        except OSError:
+            pass  # The on-disk cache is best-effort
 
     # =========================================================================
     # Projects
@@ -145,7 +849,7 @@ class TestmoClient:
         Returns:
             List of project objects with id, name, and other metadata.
         """
-        result = await self._request("GET", "/projects")
+        result = await self._request("GET", "/projects", cache=True)
         return result.get("result", [])
 
     async def get_project(self, project_id: int) -> dict[str, Any]:
@@ -158,7 +862,7 @@ class TestmoClient:
         Returns:
             Project object with full details.
         """
-        result = await self._request("GET", f"/projects/{project_id}")
+        result = await self._request("GET", f"/projects/{project_id}", cache=True)
         return result.get("result", result)
 
     # =========================================================================
@@ -186,32 +890,34 @@ class TestmoClient:
             "GET",
             f"/projects/{project_id}/folders",
             params={"page": page, "per_page": per_page},
+            cache=True,
         )
 
-    async def get_all_folders(self, project_id: int) -> list[dict[str, Any]]:
+    def iter_all_folders(self, project_id: int) -> AsyncIterator[dict[str, Any]]:
         """
-        Get all folders in a project (handles pagination automatically).
+        Iterate over all folders in a project, page by page.
 
         Args:
             project_id: The project ID.
 
         Returns:
-            List of all folder objects in the project.
+            Async iterator of folder objects.
         """
-        all_folders: list[dict[str, Any]] = []
-        page = 1
+        return iter_pages(
+            lambda page: self.list_folders(project_id, page=page, per_page=100)
+        )
 
-        while True:
-            result = await self.list_folders(project_id, page=page, per_page=100)
-            folders = result.get("result", [])
-            all_folders.extend(folders)
+    async def get_all_folders(self, project_id: int) -> list[dict[str, Any]]:
+        """
+        Get all folders in a project (handles pagination automatically).
 
-            if result.get("next_page") is None:
-                break
-            page += 1
-            await asyncio.sleep(self.RATE_LIMIT_DELAY)
+        Args:
+            project_id: The project ID.
 
-        return all_folders
+        Returns:
+            List of all folder objects in the project.
+        """
+        return [folder async for folder in self.iter_all_folders(project_id)]
 
     async def get_folder(self, project_id: int, folder_id: int) -> dict[str, Any]:
         """
@@ -225,7 +931,7 @@ class TestmoClient:
             Folder object with full details.
         """
         result = await self._request(
-            "GET", f"/projects/{project_id}/folders/{folder_id}"
+            "GET", f"/projects/{project_id}/folders/{folder_id}", cache=True
         )
         return result.get("result", result)
 
@@ -250,6 +956,7 @@ class TestmoClient:
         if parent_id:
             folder_data["parent_id"] = parent_id
 
+        self._folder_index.pop(project_id, None)
         result = await self._request(
             "POST", f"/projects/{project_id}/folders", data={"folders": [folder_data]}
         )
@@ -281,6 +988,7 @@ class TestmoClient:
         if parent_id is not None:
             data["parent_id"] = parent_id
 
+        self._folder_index.pop(project_id, None)
         result = await self._request(
             "PUT", f"/projects/{project_id}/folders/{folder_id}", data=data
         )
@@ -297,6 +1005,7 @@ class TestmoClient:
         Returns:
             Success status.
         """
+        self._folder_index.pop(project_id, None)
         return await self._request(
             "DELETE", f"/projects/{project_id}/folders/{folder_id}"
         )
@@ -318,16 +1027,20 @@ class TestmoClient:
         Returns:
             Folder object if found, None otherwise.
         """
-        all_folders = await self.get_all_folders(project_id)
-
-        for folder in all_folders:
-            folder_parent = folder.get("parent_id") or 0
-            search_parent = parent_id or 0
-
-            if folder["name"] == name and folder_parent == search_parent:
-                return folder
-
-        return None
+        cached = self._folder_index.get(project_id)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            index = cached[1]
+        else:
+            folders = await self.get_all_folders(project_id)
+            # Built in reverse so the first match wins, as with a top-to-bottom scan
+            index = {
+                (folder.get("parent_id") or 0, folder["name"]): folder
+                for folder in reversed(folders)
+            }
+            self._folder_index[project_id] = (time.monotonic(), index)
+
+        match = index.get((parent_id or 0, name))
+        return dict(match) if match is not None else None
 
     # =========================================================================
     # Milestones
@@ -354,14 +1067,15 @@ class TestmoClient:
         Returns:
             Paginated list of milestone objects.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if is_completed is not None:
-            params["is_completed"] = is_completed
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(
+            page=page,
+            per_page=per_page,
+            is_completed=is_completed,
+            expands=expands,
+        )
 
         return await self._request(
-            "GET", f"/projects/{project_id}/milestones", params=params
+            "GET", f"/projects/{project_id}/milestones", params=params, cache=True
         )
 
     async def get_milestone(
@@ -379,14 +1093,13 @@ class TestmoClient:
         Returns:
             Milestone object with full details.
         """
-        params: dict[str, Any] = {}
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(expands=expands)
 
         result = await self._request(
             "GET",
             f"/milestones/{milestone_id}",
-            params=params if params else None,
+            params=params or None,
+            cache=True,
         )
         return result.get("result", result)
 
@@ -413,45 +1126,52 @@ class TestmoClient:
         Returns:
             Paginated result with test cases and pagination info.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if folder_id:
-            params["folder_id"] = folder_id
+        params = _query_params(page=page, per_page=per_page, folder_id=folder_id)
 
         return await self._request(
             "GET", f"/projects/{project_id}/cases", params=params
         )
 
-    async def get_all_cases(
+    def iter_all_cases(
         self,
         project_id: int,
         folder_id: int | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> AsyncIterator[dict[str, Any]]:
         """
-        Get all test cases in a project or folder (handles pagination).
+        Iterate over all test cases in a project or folder, page by page.
+
+        Cases are yielded as soon as their page arrives, so callers can
+        process them without holding the full result set.
 
         Args:
             project_id: The project ID.
             folder_id: Filter by folder (optional).
 
         Returns:
-            List of all test case objects.
+            Async iterator of test case objects.
         """
-        all_cases: list[dict[str, Any]] = []
-        page = 1
-
-        while True:
-            result = await self.list_cases(
+        return iter_pages(
+            lambda page: self.list_cases(
                 project_id, folder_id=folder_id, page=page, per_page=100
             )
-            cases = result.get("result", [])
-            all_cases.extend(cases)
+        )
+
+    async def get_all_cases(
+        self,
+        project_id: int,
+        folder_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get all test cases in a project or folder (handles pagination).
 
-            if result.get("next_page") is None:
-                break
-            page += 1
-            await asyncio.sleep(self.RATE_LIMIT_DELAY)
+        Args:
+            project_id: The project ID.
+            folder_id: Filter by folder (optional).
 
-        return all_cases
+        Returns:
+            List of all test case objects.
+        """
+        return [case async for case in self.iter_all_cases(project_id, folder_id)]
 
     async def get_case(self, project_id: int, case_id: int) -> dict[str, Any]:
         """
@@ -469,6 +1189,28 @@ class TestmoClient:
         )
         return result.get("result", result)
 
+    async def get_cases_bulk(
+        self, project_id: int, case_ids: list[int]
+    ) -> list[dict[str, Any]]:
+        """
+        Get details of several test cases concurrently.
+
+        Requests are multiplexed over the pooled connection and bounded by
+        ``max_concurrency``; duplicate IDs are fetched once.
+
+        Args:
+            project_id: The project ID.
+            case_ids: Test case IDs to fetch.
+
+        Returns:
+            Test case objects, in the order of ``case_ids``.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.get_case(project_id, case_id) for case_id in case_ids)
+            )
+        )
+
     async def create_case(
         self, project_id: int, case_data: dict[str, Any]
     ) -> dict[str, Any]:
@@ -527,24 +1269,27 @@ class TestmoClient:
         Returns:
             Combined result with all created cases and any errors.
         """
-        all_created: list[dict[str, Any]] = []
-        errors: list[str] = []
-
-        # Split into batches
-        for i in range(0, len(cases), self.MAX_CASES_PER_REQUEST):
-            batch = cases[i : i + self.MAX_CASES_PER_REQUEST]
-            batch_num = (i // self.MAX_CASES_PER_REQUEST) + 1
+        batches = [
+            cases[i : i + self.MAX_CASES_PER_REQUEST]
+            for i in range(0, len(cases), self.MAX_CASES_PER_REQUEST)
+        ]
 
+        async def submit(batch: list[dict[str, Any]]) -> dict[str, Any] | str:
             try:
-                result = await self.create_cases(project_id, batch)
-                created = result.get("result", [])
-                all_created.extend(created)
+                return await self.create_cases(project_id, batch)
             except TestmoAPIError as e:
-                errors.append(f"Batch {batch_num}: {e.message}")
+                return e.message
 
-            # Rate limiting between batches
-            if i + self.MAX_CASES_PER_REQUEST < len(cases):
-                await asyncio.sleep(self.RATE_LIMIT_DELAY)
+        # Batches are submitted concurrently; _request bounds how many run at once
+        outcomes = await asyncio.gather(*(submit(batch) for batch in batches))
+
+        all_created: list[dict[str, Any]] = []
+        errors: list[str] = []
+        for batch_num, outcome in enumerate(outcomes, start=1):
+            if isinstance(outcome, str):
+                errors.append(f"Batch {batch_num}: {outcome}")
+            else:
+                all_created.extend(outcome.get("result", []))
 
         return {
             "result": all_created,
@@ -589,11 +1334,45 @@ class TestmoClient:
             "DELETE", f"/projects/{project_id}/cases/{case_id}"
         )
 
+    async def delete_cases(
+        self, project_id: int, case_ids: list[int]
+    ) -> dict[str, Any]:
+        """
+        Delete multiple test cases in one request.
+
+        Args:
+            project_id: The project ID.
+            case_ids: List of test case IDs (max 100 per request).
+
+        Returns:
+            Success status.
+
+        Raises:
+            ValueError: If more than 100 case IDs are provided.
+        """
+        if len(case_ids) > self.MAX_CASES_PER_REQUEST:
+            raise ValueError(
+                f"Too many cases: {len(case_ids)}. Max is {self.MAX_CASES_PER_REQUEST}. "
+                "Use batch_delete_cases for larger batches."
+            )
+
+        return await self._request(
+            "DELETE",
+            f"/projects/{project_id}/cases",
+            data={"ids": case_ids},
+        )
+
     async def batch_delete_cases(
         self, project_id: int, case_ids: list[int]
     ) -> dict[str, Any]:
         """
-        Delete multiple test cases.
+        Delete multiple test cases (handles any number of cases).
+
+        Cases are deleted in bulk requests of up to 100. If the server
+        rejects a bulk request (400, 404 or 422), its cases are retried one
+        by one so the failures can be reported per case. Other failures
+        (timeouts, 429, 5xx) are reported for every case in the batch
+        rather than multiplied into per-case requests.
 
         Args:
             project_id: The project ID.
@@ -602,16 +1381,43 @@ class TestmoClient:
         Returns:
             Result with success count and any errors.
         """
-        deleted: list[int] = []
-        errors: list[str] = []
 
-        for case_id in case_ids:
+        async def delete_one(case_id: int) -> str | None:
             try:
                 await self.delete_case(project_id, case_id)
-                deleted.append(case_id)
             except TestmoAPIError as e:
-                errors.append(f"Case {case_id}: {e.message}")
-            await asyncio.sleep(self.RATE_LIMIT_DELAY)
+                return e.message
+            return None
+
+        async def delete_batch(batch: list[int]) -> list[str | None]:
+            try:
+                await self.delete_cases(project_id, batch)
+            except TestmoAPIError as e:
+                if e.status_code not in self.BULK_FALLBACK_STATUSES:
+                    return [e.message] * len(batch)
+                return list(await asyncio.gather(*(delete_one(cid) for cid in batch)))
+            return [None] * len(batch)
+
+        batches = [
+            case_ids[i : i + self.MAX_CASES_PER_REQUEST]
+            for i in range(0, len(case_ids), self.MAX_CASES_PER_REQUEST)
+        ]
+        # Batches are independent; _request bounds how many run at once
+        outcomes = [
+            error
+            for batch_errors in await asyncio.gather(
+                *(delete_batch(batch) for batch in batches)
+            )
+            for error in batch_errors
+        ]
+
+        deleted: list[int] = []
+        errors: list[str] = []
+        for case_id, error in zip(case_ids, outcomes):
+            if error is None:
+                deleted.append(case_id)
+            else:
+                errors.append(f"Case {case_id}: {error}")
 
         return {
             "deleted": deleted,
@@ -648,15 +1454,14 @@ class TestmoClient:
         Returns:
             Paginated search results.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if query:
-            params["query"] = query
-        if folder_id:
-            params["folder_id"] = folder_id
-        if tags:
-            params["tags"] = ",".join(tags)
-        if state_id:
-            params["state_id"] = state_id
+        params = _query_params(
+            page=page,
+            per_page=per_page,
+            query=query,
+            folder_id=folder_id,
+            tags=tags,
+            state_id=state_id,
+        )
 
         return await self._request(
             "GET", f"/projects/{project_id}/cases", params=params
@@ -689,13 +1494,13 @@ class TestmoClient:
         Returns:
             Paginated list of test runs.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if is_closed is not None:
-            params["is_closed"] = is_closed
-        if milestone_id:
-            params["milestone_id"] = milestone_id
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(
+            page=page,
+            per_page=per_page,
+            is_closed=is_closed,
+            milestone_id=milestone_id,
+            expands=expands,
+        )
 
         return await self._request(
             "GET",
@@ -718,14 +1523,12 @@ class TestmoClient:
         Returns:
             Test run object with full details.
         """
-        params: dict[str, Any] = {}
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(expands=expands)
 
         result = await self._request(
             "GET",
             f"/runs/{run_id}",
-            params=params if params else None,
+            params=params or None,
         )
         return result.get("result", result)
 
@@ -764,21 +1567,17 @@ class TestmoClient:
         Returns:
             Paginated list of test results.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if status_id:
-            params["status_id"] = status_id
-        if assignee_id:
-            params["assignee_id"] = assignee_id
-        if created_by:
-            params["created_by"] = created_by
-        if created_after:
-            params["created_after"] = created_after
-        if created_before:
-            params["created_before"] = created_before
-        if get_latest_result is not None:
-            params["get_latest_result"] = get_latest_result
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(
+            page=page,
+            per_page=per_page,
+            status_id=status_id,
+            assignee_id=assignee_id,
+            created_by=created_by,
+            created_after=created_after,
+            created_before=created_before,
+            get_latest_result=get_latest_result,
+            expands=expands,
+        )
 
         return await self._request(
             "GET",
@@ -809,9 +1608,7 @@ class TestmoClient:
         Returns:
             Paginated list of attachment objects.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(page=page, per_page=per_page, expands=expands)
 
         return await self._request(
             "GET",
@@ -841,9 +1638,6 @@ class TestmoClient:
         Raises:
             TestmoAPIError: If the upload fails or the base64 content is invalid.
         """
-        import base64
-        import binascii
-
         # Validate and decode base64 content
         try:
             file_content = base64.b64decode(content_base64)
@@ -854,33 +1648,46 @@ class TestmoClient:
                 {"detail": "The content_base64 parameter must be valid base64-encoded data"},
             )
 
-        # Use multipart form upload with error handling
-        try:
-            response = await self.client.post(
-                f"/cases/{case_id}/attachments/single",
-                files={"file": (filename, file_content, content_type)},
-            )
-        except httpx.TimeoutException:
-            raise TestmoAPIError(408, "Upload request timed out")
-        except httpx.ConnectError as e:
-            raise TestmoAPIError(0, f"Connection error during upload: {e}")
+        return await self.upload_case_attachment_bytes(
+            case_id, filename, file_content, content_type
+        )
 
-        # Handle 204 No Content response
-        if response.status_code == 204:
-            return {"success": True}
+    async def upload_case_attachment_bytes(
+        self,
+        case_id: int,
+        filename: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> dict[str, Any]:
+        """
+        Upload a single attachment to a test case from raw bytes.
 
-        if response.status_code >= 400:
-            try:
-                error_body = response.json()
-            except Exception:
-                error_body = response.text
-            raise TestmoAPIError(
-                response.status_code,
-                f"Upload failed: {response.reason_phrase}",
-                error_body,
-            )
+        Callers that already hold the file content can use this directly and
+        skip base64 encoding and decoding.
 
-        result = response.json()
+        Args:
+            case_id: The test case ID.
+            filename: Name of the file.
+            data: File content.
+            content_type: MIME type of the file.
+
+        Returns:
+            Created attachment object.
+
+        Raises:
+            TestmoAPIError: If the upload fails.
+        """
+        endpoint = f"/cases/{case_id}/attachments/single"
+        response = await self._send(
+            "POST",
+            endpoint,
+            None,
+            None,
+            files={"file": (filename, data, content_type)},
+        )
+        await self._invalidate_cache(endpoint)
+
+        result = self._handle_response(response)
         return result.get("result", result)
 
     async def delete_case_attachments(
@@ -929,16 +1736,18 @@ class TestmoClient:
         Returns:
             Paginated list of automation sources.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if is_retired is not None:
-            params["is_retired"] = is_retired
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(
+            page=page,
+            per_page=per_page,
+            is_retired=is_retired,
+            expands=expands,
+        )
 
         return await self._request(
             "GET",
             f"/projects/{project_id}/automation/sources",
             params=params,
+            cache=True,
         )
 
     async def get_automation_source(
@@ -956,14 +1765,13 @@ class TestmoClient:
         Returns:
             Automation source object with full details.
         """
-        params: dict[str, Any] = {}
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(expands=expands)
 
         result = await self._request(
             "GET",
             f"/automation/sources/{automation_source_id}",
-            params=params if params else None,
+            params=params or None,
+            cache=True,
         )
         return result.get("result", result)
 
@@ -1002,21 +1810,17 @@ class TestmoClient:
         Returns:
             Paginated list of automation runs.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if source_id:
-            params["source_id"] = source_id
-        if milestone_id:
-            params["milestone_id"] = milestone_id
-        if status:
-            params["status"] = status
-        if created_after:
-            params["created_after"] = created_after
-        if created_before:
-            params["created_before"] = created_before
-        if tags:
-            params["tags"] = tags
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(
+            page=page,
+            per_page=per_page,
+            source_id=source_id,
+            milestone_id=milestone_id,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+            tags=tags,
+            expands=expands,
+        )
 
         return await self._request(
             "GET",
@@ -1039,14 +1843,12 @@ class TestmoClient:
         Returns:
             Automation run object with full details.
         """
-        params: dict[str, Any] = {}
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(expands=expands)
 
         result = await self._request(
             "GET",
             f"/automation/runs/{automation_run_id}",
-            params=params if params else None,
+            params=params or None,
         )
         return result.get("result", result)
 
@@ -1077,20 +1879,20 @@ class TestmoClient:
         Returns:
             Paginated list of issue connection objects.
         """
-        params: dict[str, Any] = {"page": page, "per_page": per_page}
-        if project_id is not None:
-            params["project_id"] = project_id
-        if integration_type:
-            params["integration_type"] = integration_type
-        if is_active is not None:
-            params["is_active"] = is_active
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(
+            page=page,
+            per_page=per_page,
+            project_id=project_id,
+            integration_type=integration_type,
+            is_active=is_active,
+            expands=expands,
+        )
 
         return await self._request(
             "GET",
             "/issues/connections",
             params=params,
+            cache=True,
         )
 
     async def get_issue_connection(
@@ -1108,14 +1910,13 @@ class TestmoClient:
         Returns:
             Issue connection object with full details.
         """
-        params: dict[str, Any] = {}
-        if expands:
-            params["expands"] = ",".join(expands)
+        params = _query_params(expands=expands)
 
         result = await self._request(
             "GET",
             f"/issues/connections/{connection_id}",
-            params=params if params else None,
+            params=params or None,
+            cache=True,
         )
         return result.get("result", result)
 
@@ -37,29 +37,23 @@ def _parse_args() -> argparse.Namespace:
 
 
 def _load_environment(env_file: str | None = None) -> None:
-    """Load environment variables from .env file."""
+    """Load environment variables from .env file (skippable via MCP_TESTMO_SKIP_DOTENV)."""
     if env_file:
         if not os.path.exists(env_file):
             print(f"Error: Env file not found: {env_file}", file=sys.stderr)
             sys.exit(1)
         load_dotenv(env_file)
-    else:
+    elif not os.environ.get("MCP_TESTMO_SKIP_DOTENV"):
         load_dotenv()
 
 # Initialize MCP server
 server = Server("mcp-testmo")
 
-# Global client instance (lazy initialized)
-_client: TestmoClient | None = None
-
 
 @asynccontextmanager
 async def get_client():
-    """Get or create a Testmo client."""
-    global _client
-    if _client is None:
-        _client = TestmoClient()
-    async with _client as client:
+    """Get the shared Testmo client, whose connections persist across calls."""
+    async with TestmoClient.shared() as client:
         yield client
 
 
@@ -70,8 +64,8 @@ async def get_client():
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return get_all_tools()
+    """List available tools (built once at import; the registry is static)."""
+    return TOOLS
 
 
 @server.call_tool()
@@ -100,7 +94,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 # Re-export FIELD_MAPPINGS and formatters for tests and other modules
 __all__ = ["FIELD_MAPPINGS", "format_error", "format_result", "server", "main"]
 
-# Build TOOLS list from registry for backward compatibility with tests
+# Build TOOLS once from the registry; served by list_tools and used by tests
 TOOLS = get_all_tools()
 
 
@@ -144,12 +138,17 @@ def main() -> None:
 
 async def _run_server() -> None:
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        # Open the shared client's connection pool at startup, not on the
+        # first tool call; it stays open until shutdown
+        async with TestmoClient.shared(), stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        await TestmoClient.close_shared()
 
 
 if __name__ == "__main__":
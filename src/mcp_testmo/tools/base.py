@@ -15,7 +15,7 @@ from mcp.types import Tool
 ToolHandler = Callable[..., Coroutine[Any, Any, Any]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolDefinition:
     """Container for a tool's definition and handler."""
 
@@ -27,6 +27,9 @@ class ToolDefinition:
 # Global registry of all tools
 _tool_registry: dict[str, ToolDefinition] = {}
 
+# Tool list built from the registry on first use; reset on registration
+_tool_list: list[Tool] | None = None
+
 
 def register_tool(
     name: str,
@@ -57,6 +60,7 @@ def register_tool(
     """
 
     def decorator(func: ToolHandler) -> ToolHandler:
+        global _tool_list
         tool = Tool(
             name=name,
             description=description,
@@ -67,14 +71,18 @@ def register_tool(
             handler=func,
             requires_client=requires_client,
         )
+        _tool_list = None
         return func
 
     return decorator
 
 
 def get_all_tools() -> list[Tool]:
-    """Get all registered tool definitions."""
-    return [td.tool for td in _tool_registry.values()]
+    """Get all registered tool definitions (a shared list; do not mutate)."""
+    global _tool_list
+    if _tool_list is None:
+        _tool_list = [td.tool for td in _tool_registry.values()]
+    return _tool_list
 
 
 def get_handler(name: str) -> ToolDefinition | None:
@@ -100,6 +100,34 @@ async def get_case(client: TestmoClient, args: dict[str, Any]) -> Any:
     return await client.get_case(args["project_id"], args["case_id"])
 
 
+@register_tool(
+    name="testmo_get_cases",
+    description="Get full details of several test cases by ID in one call (fetched concurrently). Use after search_cases to load the matches.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "project_id": {
+                "type": "integer",
+                "description": "The project ID",
+            },
+            "case_ids": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "Test case IDs to fetch",
+            },
+        },
+        "required": ["project_id", "case_ids"],
+    },
+)
+async def get_cases(client: TestmoClient, args: dict[str, Any]) -> Any:
+    """Get full details of several test cases."""
+    cases = await client.get_cases_bulk(args["project_id"], args["case_ids"])
+    return {
+        "total": len(cases),
+        "cases": cases,
+    }
+
+
 @register_tool(
     name="testmo_create_case",
     description="""Create a single test case in Testmo.
@@ -9,19 +9,26 @@ import asyncio
 from collections import defaultdict
 from typing import Any
 
-from mcp_testmo.client import TestmoClient
-from mcp_testmo.tools.base import register_tool
+from mcp_testmo.client import TestmoAPIError, TestmoClient, iter_pages
+from mcp_testmo.tools.base import get_handler, register_tool
+from mcp_testmo.utils import folder_path
 
 
-def _collect_subtree(
-    all_folders: list[dict[str, Any]], root_id: int
-) -> set[int]:
-    """Return set of folder IDs in the subtree rooted at root_id (inclusive)."""
+def _build_children_map(
+    all_folders: list[dict[str, Any]],
+) -> dict[int, list[int]]:
+    """Build a lookup map of parent folder ID to child folder IDs (root is 0)."""
     children_map: dict[int, list[int]] = defaultdict(list)
     for f in all_folders:
         pid = f.get("parent_id") or 0
         children_map[pid].append(f["id"])
+    return children_map
+
 
+def _collect_subtree(
+    children_map: dict[int, list[int]], root_id: int
+) -> set[int]:
+    """Return set of folder IDs in the subtree rooted at root_id (inclusive)."""
     result = {root_id}
     stack = [root_id]
     while stack:
@@ -40,47 +47,48 @@ def _build_folder_map(
 
 
 def _get_folder_path(
-    folder_id: int, folder_map: dict[int, dict[str, Any]]
+    folder_id: int,
+    folder_map: dict[int, dict[str, Any]],
+    cache: dict[int, str] | None = None,
 ) -> str:
-    """Build full path string for a folder by walking up the parent chain."""
+    """
+    Build full path string for a folder by walking up the parent chain.
+
+    Pass the same ``cache`` for every lookup in a request so ancestor paths
+    are built once and reused.
+    """
     if folder_id not in folder_map:
         return ""
-    folder = folder_map[folder_id]
-    path_parts = [folder["name"]]
-    parent_id = folder.get("parent_id")
-    while parent_id and parent_id in folder_map:
-        parent = folder_map[parent_id]
-        path_parts.insert(0, parent["name"])
-        parent_id = parent.get("parent_id")
-    return " / ".join(path_parts)
+    return folder_path(folder_id, folder_map, {} if cache is None else cache)
 
 
 def _build_folder_tree(
-    all_folders: list[dict[str, Any]],
-    subtree_ids: set[int],
+    children_map: dict[int, list[int]],
     root_id: int,
     folder_map: dict[int, dict[str, Any]],
 ) -> dict[str, Any] | None:
-    """Build a nested tree structure from a flat folder list for a subtree."""
-    children_map: dict[int, list[dict[str, Any]]] = defaultdict(list)
-
-    for f in all_folders:
-        if f["id"] not in subtree_ids:
-            continue
-        pid = f.get("parent_id") or 0
-        children_map[pid].append(f)
-
-    def build_node(folder: dict[str, Any]) -> dict[str, Any]:
-        node = {**folder}
-        node["full_path"] = _get_folder_path(folder["id"], folder_map)
-        node["children"] = [
-            build_node(child) for child in children_map.get(folder["id"], [])
-        ]
-        return node
-
+    """Build a nested tree structure for the subtree rooted at root_id."""
     if root_id not in folder_map:
         return None
-    return build_node(folder_map[root_id])
+
+    # Iterative pre-order walk: each node is attached to its parent's
+    # children list as it is visited, so deep trees never hit the recursion
+    # limit. Children are pushed reversed to keep their original order.
+    paths: dict[int, str] = {}
+    root: dict[str, Any] = {}
+    stack: list[tuple[int, list[dict[str, Any]] | None]] = [(root_id, None)]
+    while stack:
+        fid, siblings = stack.pop()
+        node = {**folder_map[fid]}
+        node["full_path"] = _get_folder_path(fid, folder_map, paths)
+        node["children"] = []
+        if siblings is None:
+            root = node
+        else:
+            siblings.append(node)
+        for child_id in reversed(children_map.get(fid, [])):
+            stack.append((child_id, node["children"]))
+    return root
 
 
 @register_tool(
@@ -118,8 +126,9 @@ async def get_folders_recursive(
     if folder_id not in folder_map:
         return {"error": f"Folder {folder_id} not found in project {project_id}"}
 
-    subtree_ids = _collect_subtree(all_folders, folder_id)
-    tree = _build_folder_tree(all_folders, subtree_ids, folder_id, folder_map)
+    children_map = _build_children_map(all_folders)
+    subtree_ids = _collect_subtree(children_map, folder_id)
+    tree = _build_folder_tree(children_map, folder_id, folder_map)
 
     return {
         "total_folders": len(subtree_ids),
@@ -168,15 +177,23 @@ async def get_cases_recursive(
     if folder_id not in folder_map:
         return {"error": f"Folder {folder_id} not found in project {project_id}"}
 
-    subtree_ids = _collect_subtree(all_folders, folder_id)
+    subtree_ids = _collect_subtree(_build_children_map(all_folders), folder_id)
 
     all_cases: list[dict[str, Any]] = []
     folder_summary: list[dict[str, Any]] = []
 
-    for fid in sorted(subtree_ids):
-        cases = await client.get_all_cases(project_id, folder_id=fid)
+    # Fetch every folder concurrently; the client caps requests in flight
+    folder_ids = sorted(subtree_ids)
+    cases_by_folder = await asyncio.gather(
+        *(client.get_all_cases(project_id, folder_id=fid) for fid in folder_ids)
+    )
+
+    paths: dict[int, str] = {}
+    for fid, cases in zip(folder_ids, cases_by_folder):
         folder_name = folder_map[fid]["name"] if fid in folder_map else str(fid)
-        folder_path = _get_folder_path(fid, folder_map) if include_path else None
+        folder_path = (
+            _get_folder_path(fid, folder_map, paths) if include_path else None
+        )
 
         if cases:
             folder_summary.append({
@@ -192,9 +209,6 @@ async def get_cases_recursive(
                 case["_folder_path"] = folder_path
             all_cases.append(case)
 
-        if len(subtree_ids) > 1:
-            await asyncio.sleep(client.RATE_LIMIT_DELAY)
-
     return {
         "total_cases": len(all_cases),
         "total_folders_searched": len(subtree_ids),
@@ -227,15 +241,26 @@ def _apply_client_filters(
     result = cases
 
     if custom_filters:
+        # Split the filters once per call; "contains" needles are lowered here
+        # rather than for every case
+        contains = match_mode == "contains"
+        exact_items = [
+            (k, v) for k, v in custom_filters.items()
+            if not (contains and isinstance(v, str))
+        ]
+        substring_items = [
+            (k, v.lower()) for k, v in custom_filters.items()
+            if contains and isinstance(v, str)
+        ]
+
         def _match_custom(case: dict[str, Any]) -> bool:
-            for k, v in custom_filters.items():
+            for k, v in exact_items:
+                if case.get(k) != v:
+                    return False
+            for k, needle in substring_items:
                 case_val = case.get(k)
-                if match_mode == "contains" and isinstance(v, str):
-                    if not isinstance(case_val, str) or v.lower() not in case_val.lower():
-                        return False
-                else:
-                    if case_val != v:
-                        return False
+                if not isinstance(case_val, str) or needle not in case_val.lower():
+                    return False
             return True
 
         result = [c for c in result if _match_custom(c)]
@@ -368,7 +393,7 @@ async def search_cases_recursive(
             return {
                 "error": f"Folder {folder_id} not found in project {project_id}"
             }
-        subtree_ids = _collect_subtree(all_folders, folder_id)
+        subtree_ids = _collect_subtree(_build_children_map(all_folders), folder_id)
     else:
         # Project-wide: search all folders + root (no folder_id filter)
         subtree_ids = None
@@ -377,13 +402,18 @@ async def search_cases_recursive(
 
     all_matches: list[dict[str, Any]] = []
     folder_summary: list[dict[str, Any]] = []
+    paths: dict[int, str] = {}
 
     if subtree_ids is not None:
-        # Folder-scoped: search per folder in subtree
-        for fid in sorted(subtree_ids):
-            folder_cases = await _search_paginated(
-                client, project_id, query, fid, tags, state_id
+        # Folder-scoped: search every folder in the subtree concurrently
+        folder_ids = sorted(subtree_ids)
+        results = await asyncio.gather(
+            *(
+                _search_paginated(client, project_id, query, fid, tags, state_id)
+                for fid in folder_ids
             )
+        )
+        for fid, folder_cases in zip(folder_ids, results):
 
             if has_client_filters:
                 folder_cases = _apply_client_filters(
@@ -392,7 +422,7 @@ async def search_cases_recursive(
                 )
 
             folder_name = folder_map[fid]["name"] if fid in folder_map else str(fid)
-            folder_path = _get_folder_path(fid, folder_map)
+            folder_path = _get_folder_path(fid, folder_map, paths)
 
             if folder_cases:
                 folder_summary.append({
@@ -406,9 +436,6 @@ async def search_cases_recursive(
                 case["_folder_name"] = folder_name
                 case["_folder_path"] = folder_path
                 all_matches.append(case)
-
-            if len(subtree_ids) > 1:
-                await asyncio.sleep(client.RATE_LIMIT_DELAY)
     else:
         # Project-wide: single paginated search with no folder_id
         all_cases = await _search_paginated(
@@ -426,7 +453,7 @@ async def search_cases_recursive(
             cfid = case.get("folder_id")
             if cfid and cfid in folder_map:
                 case["_folder_name"] = folder_map[cfid]["name"]
-                case["_folder_path"] = _get_folder_path(cfid, folder_map)
+                case["_folder_path"] = _get_folder_path(cfid, folder_map, paths)
             else:
                 case["_folder_name"] = str(cfid) if cfid else "root"
                 case["_folder_path"] = ""
@@ -444,7 +471,7 @@ async def search_cases_recursive(
             folder_summary.append({
                 "folder_id": fid_key,
                 "folder_name": folder_name,
-                "folder_path": _get_folder_path(fid_key, folder_map),
+                "folder_path": _get_folder_path(fid_key, folder_map, paths),
                 "match_count": count,
             })
 
@@ -466,11 +493,14 @@ async def _search_paginated(
     tags: list[str] | None,
     state_id: int | None,
 ) -> list[dict[str, Any]]:
-    """Auto-paginate search_cases results for a single folder (or all)."""
-    all_cases: list[dict[str, Any]] = []
-    page = 1
-    while True:
-        result = await client.search_cases(
+    """
+    Auto-paginate search_cases results for a single folder (or all).
+
+    Pages after the first are fetched concurrently when the response
+    reports how many there are.
+    """
+    pages = iter_pages(
+        lambda page: client.search_cases(
             project_id,
             query=query,
             folder_id=folder_id,
@@ -479,12 +509,70 @@ async def _search_paginated(
             page=page,
             per_page=100,
         )
-        cases = result.get("result", [])
-        all_cases.extend(cases)
+    )
+    return [case async for case in pages]
 
-        if result.get("next_page") is None:
-            break
-        page += 1
-        await asyncio.sleep(client.RATE_LIMIT_DELAY)
 
-    return all_cases
+@register_tool(
+    name="testmo_batch_call",
+    description=(
+        "Run several Testmo tools in one call. Calls run concurrently over "
+        "the shared connection pool and results are returned in request "
+        "order; a failing call reports its error without affecting the others."
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Tool name, e.g. testmo_get_case",
+                        },
+                        "arguments": {
+                            "type": "object",
+                            "description": "Arguments for the tool",
+                        },
+                    },
+                    "required": ["name"],
+                },
+                "description": "Tool calls to run",
+            },
+        },
+        "required": ["calls"],
+    },
+)
+async def batch_call(client: TestmoClient, args: dict[str, Any]) -> Any:
+    """Run several tool calls concurrently with one client."""
+    calls: list[dict[str, Any]] = args["calls"]
+    results = await asyncio.gather(
+        *(_run_batched_call(client, call) for call in calls)
+    )
+    return {"total": len(results), "results": results}
+
+
+async def _run_batched_call(
+    client: TestmoClient, call: dict[str, Any]
+) -> dict[str, Any]:
+    """Run one call of a batch, reporting failures in its result entry."""
+    name = call["name"]
+    arguments = call.get("arguments") or {}
+    try:
+        tool_def = get_handler(name)
+        if tool_def is None or name == "testmo_batch_call":
+            raise ValueError(f"Unknown tool: {name}")
+        if tool_def.requires_client:
+            result = await tool_def.handler(client, arguments)
+        else:
+            result = await tool_def.handler(arguments)
+        return {"name": name, "result": result}
+    except TestmoAPIError as e:
+        return {
+            "name": name,
+            "error": {"status_code": e.status_code, "message": e.message},
+        }
+    except Exception as e:
+        return {"name": name, "error": {"message": str(e)}}
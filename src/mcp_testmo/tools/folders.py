@@ -6,6 +6,7 @@ from typing import Any
 
 from mcp_testmo.client import TestmoClient
 from mcp_testmo.tools.base import register_tool
+from mcp_testmo.utils import build_folder_paths
 
 
 @register_tool(
@@ -26,15 +27,9 @@ async def list_folders(client: TestmoClient, args: dict[str, Any]) -> Any:
     """List all folders in a project with full paths."""
     folders = await client.get_all_folders(args["project_id"])
     # Build folder paths for easier reading
-    folder_map = {f["id"]: f for f in folders}
+    paths = build_folder_paths(folders)
     for folder in folders:
-        path_parts = [folder["name"]]
-        parent_id = folder.get("parent_id")
-        while parent_id and parent_id in folder_map:
-            parent = folder_map[parent_id]
-            path_parts.insert(0, parent["name"])
-            parent_id = parent.get("parent_id")
-        folder["full_path"] = " / ".join(path_parts)
+        folder["full_path"] = paths[folder["id"]]
     return folders
 
 
@@ -65,3 +65,16 @@ async def get_web_url(client: TestmoClient, args: dict[str, Any]) -> Any:
             args.get("resource_id"),
         )
     }
+
+
+@register_tool(
+    name="testmo_cache_clear",
+    description="Clear cached Testmo responses (projects, folders, milestones, etc.). Use when data was changed outside this session and fresh results are needed immediately.",
+    input_schema={
+        "type": "object",
+        "properties": {},
+    },
+)
+async def cache_clear(client: TestmoClient, args: dict[str, Any]) -> Any:
+    """Clear the client's response cache."""
+    return {"cleared": await client.clear_cache()}
@@ -3,26 +3,92 @@ Utility functions for the MCP Testmo server.
 """
 
 import json
+import os
 from typing import Any
 
 from mcp_testmo.client import TestmoAPIError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the extra
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(data: Any) -> str:
+    """
+    Serialize to JSON, using orjson when it is installed.
+
+    Output is compact unless TESTMO_PRETTY_JSON=1, which indents it for
+    debugging at roughly twice the size.
+    """
+    pretty = os.environ.get("TESTMO_PRETTY_JSON") == "1"
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those
+    if pretty:
+        return json.dumps(data, indent=2, default=str, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), default=str, ensure_ascii=False)
+
+
+def build_folder_paths(folders: list[dict[str, Any]]) -> dict[int, str]:
+    """Map each folder ID to its " / "-joined path from the root."""
+    folder_map = {f["id"]: f for f in folders}
+    paths: dict[int, str] = {}
+    for folder in folders:
+        folder_path(folder["id"], folder_map, paths)
+    return paths
+
+
+def folder_path(
+    folder_id: int,
+    folder_map: dict[int, dict[str, Any]],
+    paths: dict[int, str],
+) -> str:
+    """
+    Get a folder's " / "-joined path from the root, memoized in ``paths``.
+
+    Only ancestors without a known path are walked, and each is built from
+    its parent's path, so folders sharing ancestors share the work and deep
+    trees stay linear.
+    """
+    chain: list[int] = []
+    seen: set[int] = set()
+    fid: int | None = folder_id
+    while fid is not None and fid not in paths:
+        chain.append(fid)
+        seen.add(fid)
+        parent_id = folder_map[fid].get("parent_id")
+        if parent_id and parent_id in folder_map and parent_id not in seen:
+            fid = parent_id
+        else:
+            fid = None  # Root, unknown parent, or malformed cycle
+    prefix = paths[fid] + " / " if fid is not None else ""
+    for node_id in reversed(chain):
+        prefix += folder_map[node_id]["name"]
+        paths[node_id] = prefix
+        prefix += " / "
+    return paths[folder_id]
+
 
 def format_error(e: Exception) -> str:
     """Format an exception as a JSON error response."""
     if isinstance(e, TestmoAPIError):
-        return json.dumps(
+        return _dumps(
             {
                 "error": True,
                 "status_code": e.status_code,
                 "message": e.message,
                 "details": e.details,
-            },
-            indent=2,
+            }
         )
-    return json.dumps({"error": True, "message": str(e)}, indent=2)
+    return _dumps({"error": True, "message": str(e)})
 
 
 def format_result(data: Any) -> str:
     """Format a result as JSON."""
-    return json.dumps(data, indent=2, default=str)
+    return _dumps(data)
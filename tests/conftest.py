@@ -9,6 +9,7 @@ def mock_env_vars(monkeypatch):
     """Set mock environment variables for testing."""
     monkeypatch.setenv("TESTMO_URL", "https://test.testmo.net")
     monkeypatch.setenv("TESTMO_API_KEY", "test-api-key")
+    monkeypatch.setenv("MCP_TESTMO_SKIP_DOTENV", "1")
 
 
 @pytest.fixture
@@ -1,7 +1,31 @@
 """Tests for the Testmo client."""
 
+import asyncio
+import email.utils
+import json
+import time
+from unittest.mock import AsyncMock
+
+import httpx
 import pytest
-from mcp_testmo.client import TestmoAPIError, TestmoClient
+
+import mcp_testmo.client as client_module
+from mcp_testmo.client import (
+    TestmoAPIError,
+    TestmoClient,
+    _ConcurrencyLimiter,
+    _RateLimitedTransport,
+)
+
+
+def make_page(page: int, total_pages: int, include_last_page: bool = True) -> dict:
+    """Create a paginated API response with two items for a page."""
+    return {
+        "page": page,
+        "next_page": page + 1 if page < total_pages else None,
+        "last_page": total_pages if include_last_page else None,
+        "result": [{"id": page * 100 + i} for i in range(2)],
+    }
 
 
 class TestTestmoClient:
@@ -25,6 +49,24 @@ class TestTestmoClient:
         assert client.base_url == "https://custom.testmo.net"
         assert client.api_key == "custom-key"
 
+    def test_dotenv_fills_settings_missing_from_environment(self, monkeypatch):
+        """Test .env is loaded even when TESTMO_URL is already exported."""
+        monkeypatch.delenv("MCP_TESTMO_SKIP_DOTENV")
+        monkeypatch.delenv("TESTMO_API_KEY", raising=False)
+        monkeypatch.setattr(client_module, "_dotenv_loaded", False)
+
+        def fake_load_dotenv() -> None:
+            monkeypatch.setenv("TESTMO_API_KEY", "key-from-dotenv")
+            monkeypatch.setenv("TESTMO_CONCURRENCY", "4")
+
+        monkeypatch.setattr(client_module, "load_dotenv", fake_load_dotenv)
+
+        client = TestmoClient()
+
+        assert client.base_url == "https://test.testmo.net"
+        assert client.api_key == "key-from-dotenv"
+        assert client.max_concurrency == 4
+
     def test_client_missing_url(self, monkeypatch):
         """Test client raises error when URL is missing."""
         monkeypatch.delenv("TESTMO_URL", raising=False)
@@ -62,6 +104,952 @@ class TestTestmoClient:
         url = client.get_web_url(project_id=2, resource_type="runs")
         assert url == "https://test.testmo.net/runs/2"
 
+    def test_unknown_http_backend(self, monkeypatch):
+        """Test client rejects an unsupported HTTP backend."""
+        monkeypatch.setenv("TESTMO_HTTPX_BACKEND", "curl")
+
+        with pytest.raises(ValueError, match="Unsupported TESTMO_HTTPX_BACKEND"):
+            TestmoClient()
+
+    def test_concurrency_from_env(self, monkeypatch):
+        """Test TESTMO_CONCURRENCY sets the in-flight request cap."""
+        monkeypatch.setenv("TESTMO_CONCURRENCY", "3")
+        assert TestmoClient()._limiter.limit == 3
+
+        monkeypatch.setenv("TESTMO_CONCURRENCY", "0")
+        with pytest.raises(ValueError, match="Invalid TESTMO_CONCURRENCY"):
+            TestmoClient()
+
+    def test_rate_limit_from_env(self, monkeypatch):
+        """Test TESTMO_RATE_LIMIT_RPS/BURST configure the token bucket."""
+        monkeypatch.setenv("TESTMO_RATE_LIMIT_RPS", "12.5")
+        monkeypatch.setenv("TESTMO_RATE_LIMIT_BURST", "20")
+        transport = TestmoClient()._build_transport()
+        assert transport._rate == 12.5
+        assert transport._capacity == 20
+
+        monkeypatch.setenv("TESTMO_RATE_LIMIT_RPS", "fast")
+        with pytest.raises(ValueError, match="Invalid TESTMO_RATE_LIMIT_RPS"):
+            TestmoClient()
+
+        monkeypatch.setenv("TESTMO_RATE_LIMIT_RPS", "5")
+        monkeypatch.setenv("TESTMO_RATE_LIMIT_BURST", "0")
+        with pytest.raises(ValueError, match="Invalid TESTMO_RATE_LIMIT_BURST"):
+            TestmoClient()
+
+    def test_aiohttp_backend_transport(self, monkeypatch):
+        """Test the aiohttp backend builds an aiohttp transport."""
+        httpx_aiohttp = pytest.importorskip("httpx_aiohttp")
+        monkeypatch.setenv("TESTMO_HTTPX_BACKEND", "aiohttp")
+
+        client = TestmoClient()
+        transport = client._build_transport()
+        assert isinstance(transport._transport, httpx_aiohttp.AiohttpTransport)
+
+    def test_default_backend_uses_httpx_transport(self):
+        """Test the default backend wraps httpx's HTTP transport."""
+        client = TestmoClient()
+        transport = client._build_transport()
+        assert isinstance(transport, _RateLimitedTransport)
+        assert isinstance(transport._transport, httpx.AsyncHTTPTransport)
+
+    @pytest.mark.asyncio
+    async def test_context_manager_lifecycle(self):
+        """Test the HTTP client is opened on enter and closed on exit."""
+        client = TestmoClient()
+
+        async with client as entered:
+            assert entered is client
+            assert str(client.client.base_url) == "https://test.testmo.net/api/v1/"
+            assert client.client.timeout.connect == client.CONNECT_TIMEOUT
+            assert client.client.timeout.read == client.REQUEST_TIMEOUT
+
+        with pytest.raises(RuntimeError, match="Client not initialized"):
+            _ = client.client
+
+    @pytest.mark.asyncio
+    async def test_shared_enter_warms_up_with_cached_project_list(self, monkeypatch):
+        """Test the shared client's warmup request is reused by list_projects."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"result": [{"id": 1}]})
+
+        client = TestmoClient.shared()
+        monkeypatch.setattr(
+            client, "_build_transport", lambda: httpx.MockTransport(handler)
+        )
+        try:
+            async with client:
+                projects = await client.list_projects()
+        finally:
+            await TestmoClient.close_shared()
+
+        assert projects == [{"id": 1}]
+        assert [r.url.path for r in requests] == ["/api/v1/projects"]
+
+    @pytest.mark.asyncio
+    async def test_short_lived_client_does_not_warm_up(self, monkeypatch):
+        """Test entering a non-shared client sends no request of its own."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"result": {"id": 1}})
+
+        client = TestmoClient()
+        monkeypatch.setattr(
+            client, "_build_transport", lambda: httpx.MockTransport(handler)
+        )
+
+        async with client:
+            await client.get_case(1, 1)
+
+        assert [r.url.path for r in requests] == ["/api/v1/projects/1/cases/1"]
+
+    @pytest.mark.asyncio
+    async def test_warmup_ignores_unexpected_responses(self):
+        """Test a non-JSON warmup response is swallowed."""
+        client = TestmoClient()
+        use_mock_transport(client, lambda r: httpx.Response(200, text="<html>"))
+
+        await client._warm_up()
+
+    @pytest.mark.asyncio
+    async def test_request_body_is_encoded_as_json(self):
+        """Test request data is sent as a JSON body with its content type."""
+        client = TestmoClient()
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": [{"id": 7}]})
+        )
+
+        await client.create_folder(1, "Login", parent_id=3)
+
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert json.loads(requests[0].content) == {
+            "folders": [{"name": "Login", "parent_id": 3}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_unset_filters_are_omitted_from_query(self):
+        """Test list filters drop unset values but keep False and join lists."""
+        client = TestmoClient()
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": []})
+        )
+
+        await client.list_runs(1, is_closed=False, expands=["users", "milestones"])
+
+        assert dict(requests[0].url.params) == {
+            "page": "1",
+            "per_page": "100",
+            "is_closed": "false",
+            "expands": "users,milestones",
+        }
+
+    @pytest.mark.asyncio
+    async def test_shared_client_stays_open_across_enters(self):
+        """Test the shared client reuses one HTTP client until closed."""
+        shared = TestmoClient.shared()
+        shared.WARMUP_ON_ENTER = False
+        try:
+            assert TestmoClient.shared() is shared
+
+            async with shared:
+                http_client = shared.client
+            async with shared:
+                assert shared.client is http_client
+        finally:
+            await TestmoClient.close_shared()
+
+        with pytest.raises(RuntimeError, match="Client not initialized"):
+            _ = shared.client
+        assert TestmoClient.shared() is not shared
+        await TestmoClient.close_shared()
+
+
+def use_mock_transport(client: TestmoClient, handler) -> list[httpx.Request]:
+    """Route the client's HTTP traffic to `handler`, recording each request."""
+    requests: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    client._client = httpx.AsyncClient(
+        base_url=f"{client.base_url}/api/v1",
+        transport=httpx.MockTransport(record),
+    )
+    return requests
+
+
+class TestAttachments:
+    """Tests for attachment uploads."""
+
+    @pytest.mark.asyncio
+    async def test_upload_decodes_base64_into_multipart(self):
+        """Test base64 content is uploaded as the decoded file bytes."""
+        client = TestmoClient()
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": {"id": 4}})
+        )
+
+        result = await client.upload_case_attachment(9, "log.txt", "aGVsbG8=", "text/plain")
+
+        assert result == {"id": 4}
+        assert requests[0].url.path == "/api/v1/cases/9/attachments/single"
+        body = requests[0].read()
+        assert b'filename="log.txt"' in body
+        assert b"\r\n\r\nhello\r\n" in body
+
+    @pytest.mark.asyncio
+    async def test_upload_is_sent_as_multipart(self, monkeypatch):
+        """Test uploads keep their multipart content type on a real client."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(422, json={"message": "Too large"})
+
+        client = TestmoClient()
+        monkeypatch.setattr(
+            client, "_build_transport", lambda: httpx.MockTransport(handler)
+        )
+
+        async with client:
+            with pytest.raises(TestmoAPIError) as exc_info:
+                await client.upload_case_attachment_bytes(9, "a.bin", b"data")
+
+        assert requests[0].headers["Content-Type"].startswith("multipart/form-data")
+        assert exc_info.value.status_code == 422
+        assert exc_info.value.details == {"message": "Too large"}
+
+    @pytest.mark.asyncio
+    async def test_upload_rejects_invalid_base64(self):
+        """Test invalid base64 raises before any request is sent."""
+        client = TestmoClient()
+        requests = use_mock_transport(client, lambda r: httpx.Response(200))
+
+        with pytest.raises(TestmoAPIError, match="Invalid base64"):
+            await client.upload_case_attachment(9, "log.txt", "abc")
+
+        assert requests == []
+
+
+class TestPagination:
+    """Tests for auto-paginating client methods."""
+
+    @pytest.mark.asyncio
+    async def test_get_all_folders_fetches_remaining_pages_concurrently(self):
+        """Test pages after the first are all requested once last_page is known."""
+        client = TestmoClient()
+        client.list_folders = AsyncMock(
+            side_effect=lambda project_id, page, per_page: make_page(page, 4)
+        )
+
+        folders = await client.get_all_folders(1)
+
+        assert [f["id"] for f in folders] == [
+            100, 101, 200, 201, 300, 301, 400, 401,
+        ]
+        pages = sorted(c.kwargs["page"] for c in client.list_folders.call_args_list)
+        assert pages == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_get_all_cases_single_page(self):
+        """Test a single page response makes exactly one request."""
+        client = TestmoClient()
+        client.list_cases = AsyncMock(return_value=make_page(1, 1))
+
+        cases = await client.get_all_cases(1, folder_id=5)
+
+        assert len(cases) == 2
+        client.list_cases.assert_awaited_once_with(
+            1, folder_id=5, page=1, per_page=100
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_all_cases_follows_next_page_without_last_page(self):
+        """Test pages are followed sequentially when last_page is missing."""
+        client = TestmoClient()
+        client.list_cases = AsyncMock(
+            side_effect=lambda project_id, folder_id, page, per_page: make_page(
+                page, 3, include_last_page=False
+            )
+        )
+
+        cases = await client.get_all_cases(1)
+
+        assert [c["id"] for c in cases] == [100, 101, 200, 201, 300, 301]
+
+    @pytest.mark.asyncio
+    async def test_iter_all_cases_yields_before_later_pages(self):
+        """Test first-page cases are available before later pages finish."""
+        client = TestmoClient()
+        release = asyncio.Event()
+
+        async def list_cases(project_id, folder_id, page, per_page):
+            if page > 1:
+                await release.wait()
+            return make_page(page, 3)
+
+        client.list_cases = AsyncMock(side_effect=list_cases)
+
+        seen = []
+        async for case in client.iter_all_cases(1):
+            seen.append(case["id"])
+            if len(seen) == 2:
+                release.set()
+
+        assert seen == [100, 101, 200, 201, 300, 301]
+
+    @pytest.mark.asyncio
+    async def test_page_count_derived_from_total(self):
+        """Test pages are fetched concurrently when only total is reported."""
+        client = TestmoClient()
+        release = asyncio.Event()
+
+        async def list_folders(project_id, page, per_page):
+            if page == 2:
+                # Only completes once page 3 has been requested concurrently
+                await release.wait()
+            elif page == 3:
+                release.set()
+            result = make_page(page, 3, include_last_page=False)
+            result.update(total=6, per_page=2)
+            return result
+
+        client.list_folders = AsyncMock(side_effect=list_folders)
+
+        folders = await client.get_all_folders(1)
+
+        assert [f["id"] for f in folders] == [100, 101, 200, 201, 300, 301]
+
+    @pytest.mark.asyncio
+    async def test_iter_prefetches_next_page_without_last_page(self):
+        """Test the next page is requested while the current one is consumed."""
+        client = TestmoClient()
+        client.list_folders = AsyncMock(
+            side_effect=lambda project_id, page, per_page: make_page(
+                page, 3, include_last_page=False
+            )
+        )
+
+        folders = client.iter_all_folders(1)
+        first = await folders.__anext__()
+        await asyncio.sleep(0)
+
+        assert first["id"] == 100
+        requested = [c.kwargs["page"] for c in client.list_folders.call_args_list]
+        assert requested == [1, 2]
+        assert [f["id"] async for f in folders] == [101, 200, 201, 300, 301]
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_waits_for_cancelled_pages(self):
+        """Test closing the iterator early leaves no page fetch running."""
+        client = TestmoClient()
+        cancelled = []
+
+        async def list_cases(project_id, folder_id, page, per_page):
+            if page > 1:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return make_page(page, 3)
+
+        client.list_cases = AsyncMock(side_effect=list_cases)
+
+        cases = client.iter_all_cases(1)
+        assert (await cases.__anext__())["id"] == 100
+        await asyncio.sleep(0)  # Let the page fetches start
+        await cases.aclose()
+
+        assert sorted(cancelled) == [2, 3]
+
+
+class TestBatchOperations:
+    """Tests for batch create/delete client methods."""
+
+    @pytest.mark.asyncio
+    async def test_get_cases_bulk_preserves_order_and_dedupes(self):
+        """Test bulk case fetches return in input order, one request per ID."""
+        client = TestmoClient()
+        requests = use_mock_transport(
+            client,
+            lambda r: httpx.Response(
+                200, json={"result": {"id": int(r.url.path.rsplit("/", 1)[1])}}
+            ),
+        )
+
+        cases = await client.get_cases_bulk(1, [3, 5, 3])
+
+        assert [c["id"] for c in cases] == [3, 5, 3]
+        assert sorted(r.url.path for r in requests) == [
+            "/api/v1/projects/1/cases/3",
+            "/api/v1/projects/1/cases/5",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_delete_reports_partial_failures(self):
+        """Test a rejected bulk delete falls back to per-case deletes."""
+        client = TestmoClient()
+
+        async def mock_delete(project_id: int, case_id: int) -> dict:
+            if case_id == 2:
+                raise TestmoAPIError(404, "Not found")
+            return {"success": True}
+
+        client.delete_cases = AsyncMock(side_effect=TestmoAPIError(404, "Not found"))
+        client.delete_case = AsyncMock(side_effect=mock_delete)
+
+        result = await client.batch_delete_cases(1, [1, 2, 3])
+
+        assert result["deleted"] == [1, 3]
+        assert result["total_deleted"] == 2
+        assert result["errors"] == ["Case 2: Not found"]
+        assert client.delete_case.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_delete_reports_unavailable_server_without_fallback(self):
+        """Test a 429/5xx/timeout bulk failure is not retried per case."""
+        client = TestmoClient()
+        client.delete_cases = AsyncMock(
+            side_effect=TestmoAPIError(503, "Service Unavailable")
+        )
+        client.delete_case = AsyncMock()
+
+        result = await client.batch_delete_cases(1, [1, 2])
+
+        assert result["deleted"] == []
+        assert result["errors"] == [
+            "Case 1: Service Unavailable",
+            "Case 2: Service Unavailable",
+        ]
+        client.delete_case.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_delete_sends_bulk_requests_of_100(self):
+        """Test ids are deleted through the collection endpoint in chunks."""
+        client = TestmoClient()
+        requests = use_mock_transport(client, lambda r: httpx.Response(204))
+
+        result = await client.batch_delete_cases(1, list(range(250)))
+
+        assert result["total_deleted"] == 250
+        assert result["errors"] is None
+        assert all(
+            r.method == "DELETE" and r.url.path.endswith("/projects/1/cases")
+            for r in requests
+        )
+        sizes = sorted(len(json.loads(r.content)["ids"]) for r in requests)
+        assert sizes == [50, 100, 100]
+
+    @pytest.mark.asyncio
+    async def test_batch_create_preserves_batch_order(self):
+        """Test batches are split at 100 and created cases keep input order."""
+        client = TestmoClient()
+
+        async def mock_create(project_id: int, batch: list[dict]) -> dict:
+            if batch[0]["name"] == "Case 100":
+                raise TestmoAPIError(422, "Validation failed")
+            return {"result": [{"id": i, **c} for i, c in enumerate(batch)]}
+
+        client.create_cases = AsyncMock(side_effect=mock_create)
+        cases = [{"name": f"Case {i}"} for i in range(250)]
+
+        result = await client.batch_create_cases(1, cases)
+
+        assert client.create_cases.await_count == 3
+        assert result["total_submitted"] == 250
+        assert result["total_created"] == 150
+        assert result["result"][0]["name"] == "Case 0"
+        assert result["result"][-1]["name"] == "Case 249"
+        assert result["errors"] == ["Batch 2: Validation failed"]
+
+
+class TestResponseCache:
+    """Tests for the TTL cache of read-only endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_cache(self):
+        """Test a cached endpoint is fetched once within the TTL."""
+        client = TestmoClient()
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": [{"id": 1}]})
+        )
+
+        first = await client.list_projects()
+        first[0]["mutated"] = True
+        second = await client.list_projects()
+
+        assert len(requests) == 1
+        assert second == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self):
+        """Test entries older than CACHE_TTL are fetched again."""
+        client = TestmoClient()
+        client.CACHE_TTL = 0.0
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": []})
+        )
+
+        await client.list_projects()
+        await client.list_projects()
+
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_project_entries(self):
+        """Test a write under a project drops that project's cached reads only."""
+        client = TestmoClient()
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": [{"id": 9}]})
+        )
+
+        await client.list_folders(1)
+        await client.list_folders(12)
+        await client.create_folder(1, "New folder")
+        await client.list_folders(1)
+        await client.list_folders(12)
+
+        folder_reads = [
+            r.url.path for r in requests if r.method == "GET"
+        ]
+        assert folder_reads == [
+            "/api/v1/projects/1/folders",
+            "/api/v1/projects/12/folders",
+            "/api/v1/projects/1/folders",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_uncached_endpoints_always_fetch(self):
+        """Test endpoints without cache=True are not cached."""
+        client = TestmoClient()
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": {"id": 5}})
+        )
+
+        await client.get_case(1, 5)
+        await client.get_case(1, 5)
+
+        assert len(requests) == 2
+
+    def test_cache_ttl_from_env(self, monkeypatch):
+        """Test TESTMO_CACHE_TTL overrides the default TTL."""
+        monkeypatch.setenv("TESTMO_CACHE_TTL", "5")
+        assert TestmoClient().CACHE_TTL == 5.0
+
+        monkeypatch.setenv("TESTMO_CACHE_TTL", "soon")
+        with pytest.raises(ValueError, match="Invalid TESTMO_CACHE_TTL"):
+            TestmoClient()
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_refetch(self, tmp_path, monkeypatch):
+        """Test clear_cache drops memory and disk entries."""
+        monkeypatch.setenv("TESTMO_CACHE_DIR", str(tmp_path))
+        client = TestmoClient()
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": {"id": 3}})
+        )
+
+        await client.get_milestone(3)
+        assert await client.clear_cache() == 1
+        await client.get_milestone(3)
+
+        assert len(requests) == 2
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_revalidated(self):
+        """Test expired entries send validators and reuse the body on 304."""
+        client = TestmoClient()
+        client.CACHE_TTL = 0.0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={"result": [{"id": 1}]}, headers={"ETag": '"v1"'}
+            )
+
+        requests = use_mock_transport(client, handler)
+
+        await client.list_projects()
+        second = await client.list_projects()
+
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+        assert second == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_cache_dir_persists_across_clients(self, tmp_path, monkeypatch):
+        """Test TESTMO_CACHE_DIR lets a new client reuse cached responses."""
+        monkeypatch.setenv("TESTMO_CACHE_DIR", str(tmp_path))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"result": [{"id": 1}]})
+
+        first = TestmoClient()
+        first_requests = use_mock_transport(first, handler)
+        await first.list_projects()
+
+        second = TestmoClient()
+        second_requests = use_mock_transport(second, handler)
+        projects = await second.list_projects()
+
+        assert len(first_requests) == 1
+        assert second_requests == []
+        assert projects == [{"id": 1}]
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_files_are_private(self, tmp_path, monkeypatch):
+        """Test persisted cache files are readable by the owner only."""
+        monkeypatch.setenv("TESTMO_CACHE_DIR", str(tmp_path))
+        client = TestmoClient()
+        use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": [{"id": 1}]})
+        )
+        await client.list_projects()
+
+        [path] = tmp_path.glob("*.json")
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_entries_persisted_by_another_client(
+        self, tmp_path, monkeypatch
+    ):
+        """Test a write drops disk entries a previous process cached."""
+        monkeypatch.setenv("TESTMO_CACHE_DIR", str(tmp_path))
+        folders = [{"id": 1, "name": "A", "parent_id": 0}]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                folders.append({"id": 2, "name": "B", "parent_id": 0})
+                return httpx.Response(200, json={"result": [folders[-1]]})
+            return httpx.Response(
+                200, json={"result": list(folders), "next_page": None}
+            )
+
+        first = TestmoClient()
+        use_mock_transport(first, handler)
+        await first.get_all_folders(1)
+        await first.list_projects()
+
+        second = TestmoClient()
+        use_mock_transport(second, handler)
+        await second.create_folder(1, "B")
+
+        assert [f["name"] for f in await second.get_all_folders(1)] == ["A", "B"]
+        assert await second.find_folder_by_name(1, "B") is not None
+        # Entries outside the written resource stay cached
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_during_inflight_get_is_not_overwritten(self):
+        """Test a GET sent before a write doesn't cache the pre-write list."""
+        client = TestmoClient()
+        folders = [{"id": 1, "name": "A", "parent_id": 0}]
+        sent = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                folders.append({"id": 2, "name": "B", "parent_id": 0})
+                return httpx.Response(200, json={"result": [folders[-1]]})
+            body = {"result": list(folders), "next_page": None}
+            sent.set()
+            await release.wait()
+            return httpx.Response(200, json=body)
+
+        requests = use_mock_transport(client, handler)
+
+        stale_read = asyncio.create_task(client.get_all_folders(1))
+        await sent.wait()
+        await client.create_folder(1, "B")
+        release.set()
+
+        assert [f["name"] for f in await stale_read] == ["A"]
+        assert [f["name"] for f in await client.get_all_folders(1)] == ["A", "B"]
+        assert [r.method for r in requests] == ["GET", "POST", "GET"]
+
+
+class TestRequestCoalescing:
+    """Tests for sharing identical in-flight GET requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self):
+        """Test concurrent identical GETs are sent once with separate results."""
+        client = TestmoClient()
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"result": {"id": 5}})
+
+        requests = use_mock_transport(client, slow)
+
+        first, second = await asyncio.gather(
+            client.get_case(1, 5), client.get_case(1, 5)
+        )
+        first["name"] = "changed"
+
+        assert len(requests) == 1
+        assert second == {"id": 5}
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        """Test a failed shared GET raises TestmoAPIError for each caller."""
+        client = TestmoClient()
+
+        async def failing(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(404, json={"message": "missing"})
+
+        use_mock_transport(client, failing)
+
+        results = await asyncio.gather(
+            client.get_case(1, 5), client.get_case(1, 5), return_exceptions=True
+        )
+
+        assert all(isinstance(r, TestmoAPIError) for r in results)
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_caller_without_entry_does_not_share_conditional_get(self):
+        """Test a caller whose entry was invalidated gets a full response."""
+        client = TestmoClient()
+        client.CACHE_TTL = 0.0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                await asyncio.sleep(0.01)
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json={"result": [{"id": 1}]}, headers={"ETag": '"v1"'}
+            )
+
+        requests = use_mock_transport(client, handler)
+        await client.list_projects()
+
+        revalidating = asyncio.ensure_future(client.list_projects())
+        await asyncio.sleep(0)  # Conditional GET is now in flight
+        client._cache.clear()  # As a concurrent write would
+        fresh = await client.list_projects()
+
+        assert fresh == [{"id": 1}]
+        assert await revalidating == [{"id": 1}]
+        assert len(requests) == 3
+
+
+class TestFindFolderByName:
+    """Tests for folder lookup by name."""
+
+    FOLDERS = [
+        {"id": 1, "name": "Login", "parent_id": None},
+        {"id": 2, "name": "Login", "parent_id": 1},
+        {"id": 3, "name": "Signup", "parent_id": 0},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_lookup_by_parent_and_name(self):
+        """Test lookups match on name and parent, treating None as root."""
+        client = TestmoClient()
+        client.get_all_folders = AsyncMock(return_value=self.FOLDERS)
+
+        assert (await client.find_folder_by_name(1, "Login"))["id"] == 1
+        assert (await client.find_folder_by_name(1, "Login", parent_id=1))["id"] == 2
+        assert (await client.find_folder_by_name(1, "Signup"))["id"] == 3
+        assert await client.find_folder_by_name(1, "Missing") is None
+        client.get_all_folders.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_folder_writes_rebuild_index(self):
+        """Test creating a folder forces the next lookup to refetch."""
+        client = TestmoClient()
+        client.get_all_folders = AsyncMock(return_value=self.FOLDERS)
+        use_mock_transport(
+            client, lambda r: httpx.Response(200, json={"result": [{"id": 4}]})
+        )
+
+        await client.find_folder_by_name(1, "Login")
+        await client.create_folder(1, "Checkout")
+        await client.find_folder_by_name(1, "Login")
+
+        assert client.get_all_folders.await_count == 2
+
+
+class TestRateLimitedTransport:
+    """Tests for the token-bucket transport."""
+
+    @pytest.mark.asyncio
+    async def test_burst_passes_then_paces(self):
+        """Test requests within capacity are immediate and the rest are paced."""
+        now = 100.0
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            nonlocal now
+            sleeps.append(delay)
+            now += delay
+
+        transport = _RateLimitedTransport(
+            httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+            rate=50.0,
+            capacity=3,
+            clock=lambda: now,
+            sleep=fake_sleep,
+        )
+
+        async with httpx.AsyncClient(
+            transport=transport, base_url="https://test.testmo.net"
+        ) as http:
+            for _ in range(3):
+                await http.get("/projects")
+            assert sleeps == []
+
+            for _ in range(2):
+                await http.get("/projects")
+
+        assert sleeps == pytest.approx([0.02, 0.02])
+
+
+class TestConcurrencyLimiter:
+    """Tests for the resizable in-flight request cap."""
+
+    @pytest.mark.asyncio
+    async def test_limit_caps_requests_in_flight(self):
+        """Test no more than `limit` holders run at once."""
+        limiter = _ConcurrencyLimiter(2)
+        peak = 0
+
+        async def hold():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(hold() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_on_wake_up(self):
+        """Test a waiter cancelled after being notified does not strand others."""
+        limiter = _ConcurrencyLimiter(1)
+        await limiter.__aenter__()
+
+        async def wait_for_slot():
+            async with limiter:
+                pass
+
+        first = asyncio.create_task(wait_for_slot())
+        second = asyncio.create_task(wait_for_slot())
+        await asyncio.sleep(0)  # Both are now waiting on the condition
+
+        await limiter.__aexit__(None, None, None)  # Notifies `first`
+        first.cancel()
+
+        await asyncio.wait_for(second, timeout=1)
+        assert first.cancelled()
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_429_halves_limit_and_success_recovers(self):
+        """Test the client backs off on 429 and grows back on success."""
+        client = TestmoClient()
+        client.MAX_RETRIES = 0
+        statuses = iter([429, 200])
+        use_mock_transport(
+            client, lambda r: httpx.Response(next(statuses), json={"result": {}})
+        )
+
+        with pytest.raises(TestmoAPIError):
+            await client.get_case(1, 1)
+        assert client._limiter.limit == client.MAX_CONCURRENCY // 2
+
+        await client.get_case(1, 1)
+        assert client._limiter.limit == client.MAX_CONCURRENCY // 2 + 1
+
+
+class TestRateLimitRetry:
+    """Tests for retrying HTTP 429 responses."""
+
+    @pytest.mark.asyncio
+    async def test_429_is_retried_after_retry_after(self):
+        """Test a rate-limited request is retried and then succeeds."""
+        client = TestmoClient()
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"result": {"id": 1}}),
+        ])
+        requests = use_mock_transport(client, lambda r: next(responses))
+
+        case = await client.get_case(1, 1)
+
+        assert case == {"id": 1}
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_429_gives_up_after_max_retries(self):
+        """Test the final 429 is raised once retries are exhausted."""
+        client = TestmoClient()
+        client.MAX_RETRIES = 2
+        client.RETRY_BASE_DELAY = 0.0
+        requests = use_mock_transport(client, lambda r: httpx.Response(429))
+
+        with pytest.raises(TestmoAPIError) as exc_info:
+            await client.get_case(1, 1)
+
+        assert exc_info.value.status_code == 429
+        assert len(requests) == 3
+
+    def test_retry_delay_backoff_is_jittered(self):
+        """Test delays without Retry-After spread over half to full backoff."""
+        client = TestmoClient()
+
+        delays = {client._retry_delay(httpx.Response(429), 2) for _ in range(20)}
+
+        full = client.RETRY_BASE_DELAY * 4
+        assert all(full / 2 <= d <= full for d in delays)
+        assert len(delays) > 1
+
+    def test_retry_delay_parses_http_date_and_keeps_long_waits(self):
+        """Test Retry-After dates are honoured and long waits are not shortened."""
+        client = TestmoClient()
+        future = time.time() + 5
+        date = email.utils.formatdate(future, usegmt=True)
+
+        delay = client._retry_delay(
+            httpx.Response(429, headers={"Retry-After": date}), 0
+        )
+        long_wait = client._retry_delay(
+            httpx.Response(429, headers={"Retry-After": "3600"}), 0
+        )
+
+        assert 3.0 <= delay <= 5.0
+        assert long_wait == 3600.0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_max_delay_is_not_retried_early(self):
+        """Test a Retry-After longer than RETRY_MAX_DELAY raises the 429."""
+        client = TestmoClient()
+        wait = str(int(client.RETRY_MAX_DELAY * 2))
+        requests = use_mock_transport(
+            client, lambda r: httpx.Response(429, headers={"Retry-After": wait})
+        )
+
+        with pytest.raises(TestmoAPIError) as exc_info:
+            await client.get_case(1, 1)
+
+        assert exc_info.value.status_code == 429
+        assert len(requests) == 1
+
 
 class TestTestmoAPIError:
     """Tests for TestmoAPIError."""
@@ -4,12 +4,15 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from mcp_testmo.client import TestmoAPIError
 from mcp_testmo.tools.composite import (
     _apply_client_filters,
+    _build_children_map,
     _build_folder_map,
     _build_folder_tree,
     _collect_subtree,
     _get_folder_path,
+    batch_call,
     get_cases_recursive,
     get_folders_recursive,
     search_cases_recursive,
@@ -36,21 +39,29 @@ def make_case(case_id: int, name: str, folder_id: int, **extras: object) -> dict
 # ---- Helper function tests ----
 
 
+class TestBuildChildrenMap:
+    def test_groups_children_by_parent(self):
+        children = _build_children_map(FLAT_FOLDERS)
+        assert children[0] == [1, 5]
+        assert children[1] == [2, 3]
+        assert 4 not in children
+
+
 class TestCollectSubtree:
     def test_single_folder_no_children(self):
-        result = _collect_subtree(FLAT_FOLDERS, 5)
+        result = _collect_subtree(_build_children_map(FLAT_FOLDERS), 5)
         assert result == {5, 6}
 
     def test_deep_subtree(self):
-        result = _collect_subtree(FLAT_FOLDERS, 1)
+        result = _collect_subtree(_build_children_map(FLAT_FOLDERS), 1)
         assert result == {1, 2, 3, 4}
 
     def test_leaf_folder(self):
-        result = _collect_subtree(FLAT_FOLDERS, 4)
+        result = _collect_subtree(_build_children_map(FLAT_FOLDERS), 4)
         assert result == {4}
 
     def test_nonexistent_folder(self):
-        result = _collect_subtree(FLAT_FOLDERS, 999)
+        result = _collect_subtree(_build_children_map(FLAT_FOLDERS), 999)
         assert result == {999}
 
 
@@ -75,12 +86,23 @@ class TestGetFolderPath:
         fmap = _build_folder_map(FLAT_FOLDERS)
         assert _get_folder_path(999, fmap) == ""
 
+    def test_cache_holds_ancestor_paths(self):
+        fmap = _build_folder_map(FLAT_FOLDERS)
+        cache: dict[int, str] = {}
+        assert _get_folder_path(4, fmap, cache) == "Root A / Child A1 / Grandchild A1a"
+        assert cache == {
+            1: "Root A",
+            2: "Root A / Child A1",
+            4: "Root A / Child A1 / Grandchild A1a",
+        }
+        cache[1] = "Renamed"
+        assert _get_folder_path(3, fmap, cache) == "Renamed / Child A2"
+
 
 class TestBuildFolderTree:
     def test_builds_nested_tree(self):
         fmap = _build_folder_map(FLAT_FOLDERS)
-        subtree = _collect_subtree(FLAT_FOLDERS, 1)
-        tree = _build_folder_tree(FLAT_FOLDERS, subtree, 1, fmap)
+        tree = _build_folder_tree(_build_children_map(FLAT_FOLDERS), 1, fmap)
 
         assert tree is not None
         assert tree["name"] == "Root A"
@@ -96,16 +118,29 @@ class TestBuildFolderTree:
 
     def test_leaf_folder_tree(self):
         fmap = _build_folder_map(FLAT_FOLDERS)
-        subtree = _collect_subtree(FLAT_FOLDERS, 4)
-        tree = _build_folder_tree(FLAT_FOLDERS, subtree, 4, fmap)
+        tree = _build_folder_tree(_build_children_map(FLAT_FOLDERS), 4, fmap)
 
         assert tree is not None
         assert tree["name"] == "Grandchild A1a"
         assert tree["children"] == []
 
+    def test_deep_tree_does_not_recurse(self):
+        folders = [{"id": 1, "name": "F1", "parent_id": 0}] + [
+            {"id": i, "name": f"F{i}", "parent_id": i - 1} for i in range(2, 3001)
+        ]
+        fmap = _build_folder_map(folders)
+        tree = _build_folder_tree(_build_children_map(folders), 1, fmap)
+
+        depth = 0
+        while tree["children"]:
+            tree = tree["children"][0]
+            depth += 1
+        assert depth == 2999
+        assert tree["full_path"].endswith("F2999 / F3000")
+
     def test_missing_root_returns_none(self):
         fmap = _build_folder_map(FLAT_FOLDERS)
-        tree = _build_folder_tree(FLAT_FOLDERS, {999}, 999, fmap)
+        tree = _build_folder_tree(_build_children_map(FLAT_FOLDERS), 999, fmap)
         assert tree is None
 
 
@@ -115,7 +150,6 @@ class TestBuildFolderTree:
 def _mock_client(folders: list[dict] | None = None) -> MagicMock:
     """Create a mock TestmoClient."""
     client = MagicMock()
-    client.RATE_LIMIT_DELAY = 0.0
     client.get_all_folders = AsyncMock(return_value=folders or FLAT_FOLDERS)
     client.get_all_cases = AsyncMock(return_value=[])
     client.search_cases = AsyncMock(return_value={"result": [], "next_page": None})
@@ -313,6 +347,27 @@ class TestSearchCasesRecursive:
 
         assert result["total_matches"] == 150
 
+    @pytest.mark.asyncio
+    async def test_pagination_with_known_last_page(self):
+        client = _mock_client()
+
+        async def mock_search(project_id: int, page: int = 1, **kwargs: object) -> dict:
+            return {
+                "result": [make_case(page * 10 + i, f"Case {page}-{i}", 4) for i in range(2)],
+                "next_page": page + 1 if page < 3 else None,
+                "last_page": 3,
+            }
+
+        client.search_cases = AsyncMock(side_effect=mock_search)
+
+        result = await search_cases_recursive(
+            client,
+            {"project_id": 1, "folder_id": 4},
+        )
+
+        assert [c["id"] for c in result["cases"]] == [10, 11, 20, 21, 30, 31]
+        assert sorted(c.kwargs["page"] for c in client.search_cases.call_args_list) == [1, 2, 3]
+
     @pytest.mark.asyncio
     async def test_folder_not_found(self):
         client = _mock_client()
@@ -660,3 +715,37 @@ class TestApplyClientFilters:
         cases = [{"name": "A"}, {"name": "B"}]
         result = _apply_client_filters(cases, None, "exact", None, None)
         assert len(result) == 2
+
+
+class TestBatchCall:
+    @pytest.mark.asyncio
+    async def test_runs_calls_in_order(self):
+        client = MagicMock()
+        client.get_project = AsyncMock(side_effect=lambda pid: {"id": pid})
+
+        result = await batch_call(client, {"calls": [
+            {"name": "testmo_get_project", "arguments": {"project_id": 1}},
+            {"name": "testmo_get_project", "arguments": {"project_id": 2}},
+            {"name": "testmo_get_field_mappings"},
+        ]})
+
+        assert result["total"] == 3
+        assert result["results"][0] == {"name": "testmo_get_project", "result": {"id": 1}}
+        assert result["results"][1] == {"name": "testmo_get_project", "result": {"id": 2}}
+        assert "custom_priority" in result["results"][2]["result"]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_per_call(self):
+        client = MagicMock()
+        client.get_project = AsyncMock(side_effect=TestmoAPIError(404, "Not found"))
+
+        result = await batch_call(client, {"calls": [
+            {"name": "testmo_get_project", "arguments": {"project_id": 9}},
+            {"name": "testmo_nope"},
+            {"name": "testmo_batch_call", "arguments": {"calls": []}},
+        ]})
+
+        errors = [r["error"] for r in result["results"]]
+        assert errors[0] == {"status_code": 404, "message": "Not found"}
+        assert errors[1] == {"message": "Unknown tool: testmo_nope"}
+        assert errors[2] == {"message": "Unknown tool: testmo_batch_call"}
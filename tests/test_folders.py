@@ -0,0 +1,63 @@
+"""Tests for folder tools."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_testmo.tools.folders import list_folders
+from mcp_testmo.utils import build_folder_paths
+
+FOLDERS = [
+    {"id": 3, "name": "Login", "parent_id": 2},
+    {"id": 1, "name": "Root", "parent_id": None},
+    {"id": 2, "name": "Auth", "parent_id": 1},
+    {"id": 4, "name": "Logout", "parent_id": 2},
+    {"id": 5, "name": "Orphan", "parent_id": 99},
+]
+
+
+class TestBuildFolderPaths:
+    """Tests for build_folder_paths."""
+
+    def test_paths_join_ancestors(self):
+        """Test each folder's path includes its ancestors in order."""
+        paths = build_folder_paths(FOLDERS)
+
+        assert paths == {
+            1: "Root",
+            2: "Root / Auth",
+            3: "Root / Auth / Login",
+            4: "Root / Auth / Logout",
+            5: "Orphan",
+        }
+
+    def test_cycle_does_not_loop_forever(self):
+        """Test a malformed parent cycle still terminates."""
+        folders = [
+            {"id": 1, "name": "A", "parent_id": 2},
+            {"id": 2, "name": "B", "parent_id": 1},
+        ]
+
+        paths = build_folder_paths(folders)
+
+        assert set(paths) == {1, 2}
+
+
+class TestListFolders:
+    """Tests for the testmo_list_folders handler."""
+
+    @pytest.mark.asyncio
+    async def test_adds_full_path(self):
+        """Test each returned folder gets a full_path."""
+        client = MagicMock()
+        client.get_all_folders = AsyncMock(return_value=[dict(f) for f in FOLDERS])
+
+        folders = await list_folders(client, {"project_id": 1})
+
+        assert [f["full_path"] for f in folders] == [
+            "Root / Auth / Login",
+            "Root",
+            "Root / Auth",
+            "Root / Auth / Logout",
+            "Orphan",
+        ]
@@ -1,7 +1,14 @@
 """Tests for the MCP server."""
 
+import json
 
-from mcp_testmo.server import FIELD_MAPPINGS, TOOLS, format_error, format_result
+from mcp_testmo.server import (
+    FIELD_MAPPINGS,
+    TOOLS,
+    format_error,
+    format_result,
+    list_tools,
+)
 
 
 class TestTools:
@@ -23,6 +30,16 @@ class TestTools:
             assert tool.description
             assert len(tool.description) > 10
 
+    async def test_list_tools_serves_prebuilt_list(self):
+        """Test list_tools returns the tool list built at import."""
+        assert await list_tools() is TOOLS
+
+    def test_get_all_tools_is_built_once(self):
+        """Test the registry's tool list is reused across calls."""
+        from mcp_testmo.tools import get_all_tools
+
+        assert get_all_tools() is get_all_tools() is TOOLS
+
     def test_all_tools_have_schemas(self):
         """Test that all tools have input schemas."""
         for tool in TOOLS:
@@ -51,6 +68,7 @@ class TestTools:
             "testmo_list_cases",
             "testmo_get_all_cases",
             "testmo_get_case",
+            "testmo_get_cases",
             "testmo_create_case",
             "testmo_create_cases",
             "testmo_batch_create_cases",
@@ -76,6 +94,7 @@ class TestTools:
             # Utility
             "testmo_get_field_mappings",
             "testmo_get_web_url",
+            "testmo_cache_clear",
             # Composite (recursive)
             "testmo_get_folders_recursive",
             "testmo_get_cases_recursive",
@@ -194,22 +213,36 @@ class TestFormatters:
         """Test result formatting."""
         data = {"id": 1, "name": "Test"}
         result = format_result(data)
-        assert '"id": 1' in result
+        assert json.loads(result) == data
+        assert result == '{"id":1,"name":"Test"}'
+
+    def test_format_result_pretty(self, monkeypatch):
+        """Test TESTMO_PRETTY_JSON=1 indents the output."""
+        monkeypatch.setenv("TESTMO_PRETTY_JSON", "1")
+        result = format_result({"id": 1, "name": "Test"})
+        assert '\n  "id": 1' in result
         assert '"name": "Test"' in result
 
+    def test_format_result_handles_non_json_types(self):
+        """Test int keys, non-ASCII text and other types are serialized."""
+        from datetime import date
+
+        result = format_result({1: "Überprüfung", "due": date(2024, 1, 2)})
+        assert json.loads(result) == {"1": "Überprüfung", "due": "2024-01-02"}
+        assert "Überprüfung" in result
+
     def test_format_error_generic(self):
         """Test generic error formatting."""
         error = Exception("Something went wrong")
-        result = format_error(error)
-        assert '"error": true' in result
-        assert "Something went wrong" in result
+        result = json.loads(format_error(error))
+        assert result == {"error": True, "message": "Something went wrong"}
 
     def test_format_error_api(self):
         """Test API error formatting."""
         from mcp_testmo.client import TestmoAPIError
 
         error = TestmoAPIError(404, "Not found", {"detail": "Missing"})
-        result = format_error(error)
-        assert '"error": true' in result
-        assert '"status_code": 404' in result
-        assert '"message": "Not found"' in result
+        result = json.loads(format_error(error))
+        assert result["error"] is True
+        assert result["status_code"] == 404
+        assert result["message"] == "Not found"